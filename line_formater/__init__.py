@@ -38,7 +38,12 @@ A collection of text line formaters.
 """
 
 from line_formater.line_formater import LineFormater
+from line_formater.spec import ColumnSpec, FormatSpec
+from line_formater.view import TableView
 
 __all__ = [
     "LineFormater",
+    "FormatSpec",
+    "ColumnSpec",
+    "TableView",
     ]
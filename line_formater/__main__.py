@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""Command line entry point, see line_formater.cli."""
+
+import sys
+
+from line_formater.cli import main
+
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Asyncio interfaces of LineFormater, for rows coming from async iterables.
+
+Rows are formated by the same compiled formaters as table_rows and
+multi_rows, each row is formated as soon as it is received.
+"""
+
+from line_formater.line_formater import LineFormater
+
+
+async def aformat_rows(rows, line_formater=None, table=True, **kwargs):
+    """
+    Async generator of table (or multi_align if not table) formated rows
+    from an async iterable of rows, see LineFormater.table_rows.
+    auto_lengths samples the first auto_sample rows.
+
+    >>> import asyncio
+    >>> async def source():
+    ...     for row in [["key", "value"], ["foo", 1]]:
+    ...         yield row
+    ...
+    >>> async def main():
+    ...     LF = LineFormater(length=23)
+    ...     return [line async for line in aformat_rows(source(), LF)]
+    ...
+    >>> asyncio.run(main())
+    ['| key      | value    |', '| foo      | 1        |']
+    """
+    line_formater = line_formater or LineFormater()
+    if table:
+        line_formater._table_kwargs(kwargs)
+    src = kwargs.get("spec") or line_formater
+    auto_lengths = kwargs.pop("auto_lengths", src.auto_lengths)
+    auto_sample = kwargs.pop("auto_sample", src.auto_sample)
+    rows = rows.__aiter__()
+    sample = []
+    if auto_lengths and "lengths" not in kwargs:
+        async for row in rows:
+            sample.append(row)
+            if len(sample) >= auto_sample:
+                break
+        if sample:
+            kwargs["lengths"] = line_formater._auto_lengths(sample, kwargs)
+    kwargs["auto_lengths"] = False
+    formater = line_formater.compile_multi(**kwargs)
+    for row in sample:
+        yield formater(row)
+    async for row in rows:
+        yield formater(row)
+
+
+async def awrite_rows(
+    writer,
+    rows,
+    line_formater=None,
+    table=True,
+    flush_size=65536,
+    encoding="utf-8",
+    **kwargs
+):
+    """
+    Write aformat_rows to an asyncio.StreamWriter, or any object with write
+    and an awaitable drain. Lines are buffered, encoded and written every
+    flush_size characters, drain is awaited after each write.
+    Return the number of rows.
+
+    >>> import asyncio, io
+    >>> class Writer(io.BytesIO):
+    ...     async def drain(self):
+    ...         pass
+    ...
+    >>> async def source():
+    ...     for i in range(3):
+    ...         yield [i, i * i]
+    ...
+    >>> writer = Writer()
+    >>> asyncio.run(awrite_rows(writer, source(), LineFormater(length=23)))
+    3
+    >>> writer.getvalue().splitlines()[-1]
+    b'| 2        | 4        |'
+    """
+    lines = aformat_rows(rows, line_formater, table, **kwargs)
+    buffer, size, n_rows = [], 0, 0
+    async for line in lines:
+        buffer.append(line)
+        size += len(line) + 1
+        if size >= flush_size:
+            n_rows += len(buffer)
+            buffer.append("")
+            writer.write("\n".join(buffer).encode(encoding))
+            buffer, size = [], 0
+            await writer.drain()
+    if buffer:
+        n_rows += len(buffer)
+        buffer.append("")
+        writer.write("\n".join(buffer).encode(encoding))
+        await writer.drain()
+    return n_rows
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+ANSI styles (SGR escape sequences) in formated contents, see width="ansi".
+
+Styled contents are encoded once (and cached) into a form where each styled
+character is followed by a zero width marker of its style: widths,
+paddings, shifts, crops and wraps then work on visible characters, as with
+width="display", and never cut through an escape sequence. Formated lines
+are decoded back, styles being emitted again around each styled run.
+Contents without escape sequences are left as is.
+
+>>> txt = "\\x1b[31mred\\x1b[0m text"
+>>> display.width(encode(txt))
+8
+>>> decode(encode(txt)) == txt
+True
+>>> decode(display.cut(encode(txt), 1, 5))
+'\\x1b[31med\\x1b[0m t'
+"""
+
+import re
+import threading
+
+from line_formater import display
+
+
+RESET = "\x1b[0m"
+
+_sgr = re.compile(r"\x1b\[[0-9;:]*m")
+
+# Markers are pairs of variation selectors (zero width), one by style
+_BASE, _N = 0xE0100, 240
+_marker_split = re.compile(u"([\U000E0100-\U000E01EF]{2})").split
+_marker_search = re.compile(u"[\U000E0100-\U000E01EF]").search
+_space_split = re.compile(u"(?:\\s[\U000E0100-\U000E01EF]*)+").split
+MARKERS = u"".join(chr(code) for code in range(_BASE, _BASE + _N))
+_markers = {}
+_styles = {}
+_lock = threading.Lock()
+
+_cache = {}
+_cache_size = 4096
+
+
+def _marker(style):
+    """Marker of style, registered at first use."""
+    marker = _markers.get(style)
+    if marker is None:
+        with _lock:
+            marker = _markers.get(style)
+            if marker is None:
+                n = len(_markers)
+                if n >= _N * _N:
+                    raise ValueError("too many distinct styles")
+                marker = chr(_BASE + n // _N) + chr(_BASE + n % _N)
+                _styles[marker] = style
+                _markers[style] = marker
+    return marker
+
+
+def _mark(txt, style):
+    """txt with each character followed by the marker of style."""
+    if not style or not txt:
+        return txt
+    marker = _marker(style)
+    return marker.join(txt) + marker
+
+
+def _next_style(style, escape):
+    """Style after escape sequence, resets drop previous styles."""
+    params = escape[2:-1]
+    if params in ("", "0"):
+        return ""
+    if params.startswith("0;"):
+        return "\x1b[" + params[2:] + "m"
+    return style + escape
+
+
+def encode(txt):
+    """
+    Encoded form of txt (any object, Styled ones are already encoded),
+    escape sequences being replaced by markers of styled characters.
+    """
+    if isinstance(txt, Styled):
+        return txt.encoded
+    txt = str(txt)
+    if "\x1b" not in txt:
+        return txt
+    encoded = _cache.get(txt)
+    if encoded is None:
+        parts, style, position = [], "", 0
+        for match in _sgr.finditer(txt):
+            parts.append(_mark(txt[position : match.start()], style))
+            style = _next_style(style, match.group())
+            position = match.end()
+        parts.append(_mark(txt[position:], style))
+        encoded = "".join(parts)
+        if len(_cache) >= _cache_size:
+            _cache.clear()
+        _cache[txt] = encoded
+    return encoded
+
+
+def width(txt):
+    """Display width of txt (any object), escape sequences excluded."""
+    return display.width(encode(txt))
+
+
+def split(txt):
+    """
+    Words of an encoded txt, split on whitespaces and the markers of their
+    styles, as str.split().
+
+    >>> [decode(word) for word in split(encode("ab \\x1b[4m \\x1b[0m cd "))]
+    ['ab', 'cd']
+    """
+    return [word for word in _space_split(txt) if word]
+
+
+def decode(txt):
+    """Escaped form of an encoded txt."""
+    if not _marker_search(txt):
+        return txt
+    pieces = _marker_split(txt)
+    parts, current = [], ""
+    for i in range(0, len(pieces), 2):
+        text = pieces[i]
+        if i + 1 < len(pieces):
+            text, last, style = text[:-1], text[-1:], _styles[pieces[i + 1]]
+        else:
+            last, style = "", ""
+        if text:
+            if current:
+                parts.append(RESET)
+                current = ""
+            parts.append(text)
+        if last:
+            if style != current:
+                parts.append(RESET + style if current else style)
+                current = style
+            parts.append(last)
+    if current:
+        parts.append(RESET)
+    return "".join(parts)
+
+
+class Styled(str):
+    """
+    String made of spans (text, style), style being SGR escape sequences
+    ("" for none), encoded once at construction. Its value is the escaped
+    string.
+
+    >>> from line_formater import LineFormater
+    >>> error = Styled([("error", "\\x1b[1;31m"), (": disk full", "")])
+    >>> LineFormater(length=12, width="ansi").align(error, just="r")
+    '\\x1b[1;31mr\\x1b[0m: disk full'
+    """
+
+    def __new__(cls, spans):
+        spans = [(str(text), style) for text, style in spans]
+        value = "".join(
+            style + text + RESET if style and text else text for text, style in spans
+        )
+        self = str.__new__(cls, value)
+        self.encoded = "".join(_mark(text, style) for text, style in spans)
+        return self
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Benchmarks of LineFormater, for performance regression tracking.
+
+Usage: python -m line_formater.bench [-o results.json] [-b baseline.json]
+
+Each scenario of a fixed matrix is timed with timeit (best of repeat runs),
+results are printed as JSON, in seconds per call. Given a baseline file
+(previously saved results), scenarios slower than baseline by more than
+threshold are reported and the exit status is 1.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+from line_formater.line_formater import LineFormater
+
+
+SHORT = "content"
+LONG = "a quite long content, " * 8
+WORDS = ["elt1", "elt2", "elt3", "elt4"]
+
+
+def scenarios():
+    """Yield (name, function) of each benchmarked scenario."""
+    LF = LineFormater(length=80)
+    for size, content in [("short", SHORT), ("long", LONG)]:
+        for just in "lcrs":
+            elts = content if just != "s" else content.split()
+            yield (
+                "align_{}_{}".format(size, just),
+                lambda elts=elts, just=just: LF.align(elts, just=just),
+            )
+    for shift in (-3, 3):
+        yield (
+            "align_shift_{}".format(shift),
+            lambda shift=shift: LF.align(SHORT, just="c", shift=shift),
+        )
+    yield "spread_words", lambda: LF.spread(WORDS, pad=2)
+    for n_columns in (2, 10, 50):
+        row = [SHORT] * n_columns
+        length = 12 * n_columns
+        yield (
+            "multi_align_{}".format(n_columns),
+            lambda row=row, length=length: LF.multi_align(row, length=length),
+        )
+        yield (
+            "table_{}".format(n_columns),
+            lambda row=row, length=length: LF.table(row, length=length),
+        )
+        formater = LF.compile_table(length=length)
+        yield (
+            "compiled_table_{}".format(n_columns),
+            lambda row=row, formater=formater: formater(row),
+        )
+    yield "dictionary", lambda: LF.dictionary("key", "value")
+    yield "wrap_chars", lambda: LF.align(LONG * 4, crop=False)
+    yield "wrap_words", lambda: LF.align(LONG * 4, crop=False, word_wrap=True)
+    long_row = [SHORT, LONG, SHORT]
+    yield "wrap_table", lambda: LF.table(long_row, crops=[True, False, True])
+
+
+def run(repeat=5, number=None, select=""):
+    """
+    Time scenarios whose name contains select, return a dict of seconds
+    per call. If number is None, it is chosen by timeit autorange.
+    """
+    results = {}
+    for name, function in scenarios():
+        if select not in name:
+            continue
+        timer = timeit.Timer(function)
+        n = number or timer.autorange()[0]
+        results[name] = min(timer.repeat(repeat, n)) / n
+    return results
+
+
+def compare(results, baseline, threshold=0.25):
+    """
+    Return {name: ratio} of scenarios slower than baseline by more than
+    threshold (as a fraction).
+
+    >>> compare({"a": 1.5, "b": 1.1, "c": 1.0}, {"a": 1.0, "b": 1.0})
+    {'a': 1.5}
+    """
+    slower = {}
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference and seconds / reference > 1 + threshold:
+            slower[name] = round(seconds / reference, 3)
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m line_formater.bench", description=__doc__.split("\n")[1]
+    )
+    parser.add_argument("-o", "--output", help="save results as JSON to OUTPUT")
+    parser.add_argument("-b", "--baseline", help="compare results to BASELINE")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown against baseline, as a fraction (0.25)",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="runs (5)")
+    parser.add_argument("-n", "--number", type=int, help="calls per run (auto)")
+    parser.add_argument("-s", "--select", default="", help="scenarios subset")
+    args = parser.parse_args(argv)
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": run(args.repeat, args.number, args.select),
+    }
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            baseline = json.load(baseline)
+        slower = compare(report["results"], baseline["results"], args.threshold)
+        report["slower"] = slower
+        status = 1 if slower else 0
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    print(text)
+    return status
+
+
+if __name__ == "__main__":
+
+    sys.exit(main())
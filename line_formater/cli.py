@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Format delimited data (CSV, TSV) as a fixed width table.
+
+Usage: python -m line_formater [FILE] [-d DELIMITER] [--justs l,r] ...
+   or: line_formater [FILE] ...
+
+Rows are read from FILE (memory mapped) or from stdin, streamed through
+LineFormater.table_rows and written by buffered chunks to stdout, in
+constant memory whatever the size of the input. Blank lines are skipped.
+
+>>> import os, tempfile
+>>> with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+...     _ = f.write('key,value\\nfoo,1\\n\\n"b,ar",22\\n')
+...
+>>> main([f.name, "--length", "23", "--justs", "l,r"])
+| key      |    value |
+| foo      |        1 |
+| b,ar     |       22 |
+0
+>>> os.remove(f.name)
+"""
+
+import argparse
+import codecs
+import csv
+import io
+import mmap
+import os
+import sys
+
+from line_formater.line_formater import LineFormater
+
+
+def _values(convert):
+    """
+    Parser of a comma separated list of values for argparse, empty values
+    are None (default of the column). A single value is kept as is.
+
+    >>> _values(int)("10,,5"), _values(int)("1"), _values(str)("l,r")
+    ([10, None, 5], 1, ['l', 'r'])
+    """
+
+    def parse(text):
+        if "," not in text:
+            return convert(text)
+        return [convert(value) if value else None for value in text.split(",")]
+
+    return parse
+
+
+def read_lines(path, encoding="utf-8", chunk_size=1 << 20):
+    """
+    Generator of the lines of the file at path, with their line endings.
+    The file is memory mapped and decoded by chunks of chunk_size bytes.
+    Empty and non regular files (pipes) are read as usual.
+    """
+    with open(path, "rb") as stream:
+        try:
+            data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            data = None
+        if data is None:
+            for line in io.TextIOWrapper(stream, encoding, newline=""):
+                yield line
+            return
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            tail = ""
+            for start in range(0, len(data), chunk_size):
+                text = tail + decoder.decode(data[start : start + chunk_size])
+                end = text.rfind("\n") + 1
+                tail = text[end:]
+                for line in io.StringIO(text[:end], newline=""):
+                    yield line
+            for line in io.StringIO(tail + decoder.decode(b"", True), newline=""):
+                yield line
+        finally:
+            data.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m line_formater", description=__doc__.split("\n")[1]
+    )
+    parser.add_argument("file", nargs="?", default="-", help="input file (stdin)")
+    parser.add_argument(
+        "-d", "--delimiter", help="fields delimiter (, or tab for .tsv)"
+    )
+    parser.add_argument("-t", "--tsv", action="store_true", help="tab delimited")
+    parser.add_argument("-e", "--encoding", default="utf-8", help="input encoding")
+    parser.add_argument("-l", "--length", type=int, default=80, help="length (80)")
+    parser.add_argument("--lengths", type=_values(int), help="lengths of columns")
+    parser.add_argument("--justs", type=_values(str), default="l", help="l, c, r or s")
+    parser.add_argument("--pads", type=_values(int), default=1, help="paddings (1)")
+    parser.add_argument("--sep", default="|", help="separator of columns (|)")
+    parser.add_argument("--tip", default="|", help="tips of rows (|)")
+    parser.add_argument(
+        "-a", "--auto-lengths", action="store_true", help="lengths from contents"
+    )
+    parser.add_argument(
+        "--auto-sample", type=int, default=1000, help="rows measured (1000)"
+    )
+    parser.add_argument(
+        "--flush-size", type=int, default=65536, help="output buffer (65536)"
+    )
+    args = parser.parse_args(argv)
+    delimiter = args.delimiter
+    if delimiter is None:
+        tsv = args.tsv or args.file.endswith(".tsv")
+        delimiter = "\t" if tsv else ","
+    if args.file == "-":
+        lines = io.TextIOWrapper(sys.stdin.buffer, args.encoding, newline="")
+    else:
+        lines = read_lines(args.file, args.encoding)
+    kwargs = {
+        "justs": args.justs,
+        "pads": args.pads,
+        "sep": args.sep,
+        "tip": args.tip,
+        "auto_lengths": args.auto_lengths,
+        "auto_sample": args.auto_sample,
+    }
+    if args.lengths is not None:
+        kwargs["lengths"] = args.lengths
+    LF = LineFormater(length=args.length)
+    # Blank lines are read as empty rows, without columns to format
+    rows = (row for row in csv.reader(lines, delimiter=delimiter) if row)
+    try:
+        LF.write_rows(sys.stdout, rows, args.flush_size, **kwargs)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Output closed early (eg piped to head)
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Display width of strings, in terminal cells.
+
+Wide characters (east asian wide and fullwidth, emoji presentation) take two
+cells, combining marks, format and control characters take none, others take
+one. Widths are looked up by bisection in a table of code point ranges,
+generated from unicodedata (run this module to print a new one).
+Printable ASCII strings don't need any lookup.
+
+>>> width("abc"), width("日本語"), width("e\\u0301te\\u0301")
+(3, 6, 3)
+>>> "|" + center("日本", 7) + "|"
+'|  日本 |'
+"""
+
+import bisect
+import re
+
+
+_ascii = re.compile(r"[ -~]*\Z").match
+
+_cache = {}
+_cache_size = 4096
+
+# Generated from unicodedata 14.0.0
+_STARTS = (
+    0x00000, 0x0007F, 0x00300, 0x00483, 0x00591, 0x005BF, 0x005C1, 0x005C4,
+    0x005C7, 0x00600, 0x00610, 0x0061C, 0x0064B, 0x00670, 0x006D6, 0x006DF,
+    0x006E7, 0x006EA, 0x0070F, 0x00711, 0x00730, 0x007A6, 0x007EB, 0x007FD,
+    0x00816, 0x0081B, 0x00825, 0x00829, 0x00859, 0x00890, 0x00898, 0x008CA,
+    0x0093A, 0x0093C, 0x00941, 0x0094D, 0x00951, 0x00962, 0x00981, 0x009BC,
+    0x009C1, 0x009CD, 0x009E2, 0x009FE, 0x00A01, 0x00A3C, 0x00A41, 0x00A47,
+    0x00A4B, 0x00A51, 0x00A70, 0x00A75, 0x00A81, 0x00ABC, 0x00AC1, 0x00AC7,
+    0x00ACD, 0x00AE2, 0x00AFA, 0x00B01, 0x00B3C, 0x00B3F, 0x00B41, 0x00B4D,
+    0x00B55, 0x00B62, 0x00B82, 0x00BC0, 0x00BCD, 0x00C00, 0x00C04, 0x00C3C,
+    0x00C3E, 0x00C46, 0x00C4A, 0x00C55, 0x00C62, 0x00C81, 0x00CBC, 0x00CBF,
+    0x00CC6, 0x00CCC, 0x00CE2, 0x00D00, 0x00D3B, 0x00D41, 0x00D4D, 0x00D62,
+    0x00D81, 0x00DCA, 0x00DD2, 0x00DD6, 0x00E31, 0x00E34, 0x00E47, 0x00EB1,
+    0x00EB4, 0x00EC8, 0x00F18, 0x00F35, 0x00F37, 0x00F39, 0x00F71, 0x00F80,
+    0x00F86, 0x00F8D, 0x00F99, 0x00FC6, 0x0102D, 0x01032, 0x01039, 0x0103D,
+    0x01058, 0x0105E, 0x01071, 0x01082, 0x01085, 0x0108D, 0x0109D, 0x01100,
+    0x01160, 0x0135D, 0x01712, 0x01732, 0x01752, 0x01772, 0x017B4, 0x017B7,
+    0x017C6, 0x017C9, 0x017DD, 0x0180B, 0x01885, 0x018A9, 0x01920, 0x01927,
+    0x01932, 0x01939, 0x01A17, 0x01A1B, 0x01A56, 0x01A58, 0x01A60, 0x01A62,
+    0x01A65, 0x01A73, 0x01A7F, 0x01AB0, 0x01B00, 0x01B34, 0x01B36, 0x01B3C,
+    0x01B42, 0x01B6B, 0x01B80, 0x01BA2, 0x01BA8, 0x01BAB, 0x01BE6, 0x01BE8,
+    0x01BED, 0x01BEF, 0x01C2C, 0x01C36, 0x01CD0, 0x01CD4, 0x01CE2, 0x01CED,
+    0x01CF4, 0x01CF8, 0x01DC0, 0x0200B, 0x0202A, 0x02060, 0x02066, 0x020D0,
+    0x0231A, 0x02329, 0x023E9, 0x023F0, 0x023F3, 0x025FD, 0x02614, 0x02648,
+    0x0267F, 0x02693, 0x026A1, 0x026AA, 0x026BD, 0x026C4, 0x026CE, 0x026D4,
+    0x026EA, 0x026F2, 0x026F5, 0x026FA, 0x026FD, 0x02705, 0x0270A, 0x02728,
+    0x0274C, 0x0274E, 0x02753, 0x02757, 0x02795, 0x027B0, 0x027BF, 0x02B1B,
+    0x02B50, 0x02B55, 0x02CEF, 0x02D7F, 0x02DE0, 0x02E80, 0x02E9B, 0x02F00,
+    0x02FF0, 0x03000, 0x0302A, 0x0302E, 0x03041, 0x03099, 0x0309B, 0x03105,
+    0x03131, 0x03190, 0x031F0, 0x03220, 0x03250, 0x04E00, 0x0A490, 0x0A66F,
+    0x0A674, 0x0A69E, 0x0A6F0, 0x0A802, 0x0A806, 0x0A80B, 0x0A825, 0x0A82C,
+    0x0A8C4, 0x0A8E0, 0x0A8FF, 0x0A926, 0x0A947, 0x0A960, 0x0A980, 0x0A9B3,
+    0x0A9B6, 0x0A9BC, 0x0A9E5, 0x0AA29, 0x0AA31, 0x0AA35, 0x0AA43, 0x0AA4C,
+    0x0AA7C, 0x0AAB0, 0x0AAB2, 0x0AAB7, 0x0AABE, 0x0AAC1, 0x0AAEC, 0x0AAF6,
+    0x0ABE5, 0x0ABE8, 0x0ABED, 0x0AC00, 0x0F900, 0x0FB1E, 0x0FE00, 0x0FE10,
+    0x0FE20, 0x0FE30, 0x0FE54, 0x0FE68, 0x0FEFF, 0x0FF01, 0x0FFE0, 0x0FFF9,
+    0x101FD, 0x102E0, 0x10376, 0x10A01, 0x10A05, 0x10A0C, 0x10A38, 0x10A3F,
+    0x10AE5, 0x10D24, 0x10EAB, 0x10F46, 0x10F82, 0x11001, 0x11038, 0x11070,
+    0x11073, 0x1107F, 0x110B3, 0x110B9, 0x110BD, 0x110C2, 0x110CD, 0x11100,
+    0x11127, 0x1112D, 0x11173, 0x11180, 0x111B6, 0x111C9, 0x111CF, 0x1122F,
+    0x11234, 0x11236, 0x1123E, 0x112DF, 0x112E3, 0x11300, 0x1133B, 0x11340,
+    0x11366, 0x11370, 0x11438, 0x11442, 0x11446, 0x1145E, 0x114B3, 0x114BA,
+    0x114BF, 0x114C2, 0x115B2, 0x115BC, 0x115BF, 0x115DC, 0x11633, 0x1163D,
+    0x1163F, 0x116AB, 0x116AD, 0x116B0, 0x116B7, 0x1171D, 0x11722, 0x11727,
+    0x1182F, 0x11839, 0x1193B, 0x1193E, 0x11943, 0x119D4, 0x119DA, 0x119E0,
+    0x11A01, 0x11A33, 0x11A3B, 0x11A47, 0x11A51, 0x11A59, 0x11A8A, 0x11A98,
+    0x11C30, 0x11C38, 0x11C3F, 0x11C92, 0x11CAA, 0x11CB2, 0x11CB5, 0x11D31,
+    0x11D3A, 0x11D3C, 0x11D3F, 0x11D47, 0x11D90, 0x11D95, 0x11D97, 0x11EF3,
+    0x13430, 0x16AF0, 0x16B30, 0x16F4F, 0x16F8F, 0x16FE0, 0x16FE4, 0x16FF0,
+    0x17000, 0x18800, 0x18D00, 0x1AFF0, 0x1AFF5, 0x1AFFD, 0x1B000, 0x1B150,
+    0x1B164, 0x1B170, 0x1BC9D, 0x1BCA0, 0x1CF00, 0x1CF30, 0x1D167, 0x1D173,
+    0x1D185, 0x1D1AA, 0x1D242, 0x1DA00, 0x1DA3B, 0x1DA75, 0x1DA84, 0x1DA9B,
+    0x1DAA1, 0x1E000, 0x1E008, 0x1E01B, 0x1E023, 0x1E026, 0x1E130, 0x1E2AE,
+    0x1E2EC, 0x1E8D0, 0x1E944, 0x1F004, 0x1F0CF, 0x1F18E, 0x1F191, 0x1F200,
+    0x1F210, 0x1F240, 0x1F250, 0x1F260, 0x1F300, 0x1F32D, 0x1F337, 0x1F37E,
+    0x1F3A0, 0x1F3CF, 0x1F3E0, 0x1F3F4, 0x1F3F8, 0x1F440, 0x1F442, 0x1F4FF,
+    0x1F54B, 0x1F550, 0x1F57A, 0x1F595, 0x1F5A4, 0x1F5FB, 0x1F680, 0x1F6CC,
+    0x1F6D0, 0x1F6D5, 0x1F6DD, 0x1F6EB, 0x1F6F4, 0x1F7E0, 0x1F7F0, 0x1F90C,
+    0x1F93C, 0x1F947, 0x1FA70, 0x1FA78, 0x1FA80, 0x1FA90, 0x1FAB0, 0x1FAC0,
+    0x1FAD0, 0x1FAE0, 0x1FAF0, 0x20000, 0x30000, 0xE0001, 0xE0020, 0xE0100,
+)
+_ENDS = (
+    0x0001F, 0x0009F, 0x0036F, 0x00489, 0x005BD, 0x005BF, 0x005C2, 0x005C5,
+    0x005C7, 0x00605, 0x0061A, 0x0061C, 0x0065F, 0x00670, 0x006DD, 0x006E4,
+    0x006E8, 0x006ED, 0x0070F, 0x00711, 0x0074A, 0x007B0, 0x007F3, 0x007FD,
+    0x00819, 0x00823, 0x00827, 0x0082D, 0x0085B, 0x00891, 0x0089F, 0x00902,
+    0x0093A, 0x0093C, 0x00948, 0x0094D, 0x00957, 0x00963, 0x00981, 0x009BC,
+    0x009C4, 0x009CD, 0x009E3, 0x009FE, 0x00A02, 0x00A3C, 0x00A42, 0x00A48,
+    0x00A4D, 0x00A51, 0x00A71, 0x00A75, 0x00A82, 0x00ABC, 0x00AC5, 0x00AC8,
+    0x00ACD, 0x00AE3, 0x00AFF, 0x00B01, 0x00B3C, 0x00B3F, 0x00B44, 0x00B4D,
+    0x00B56, 0x00B63, 0x00B82, 0x00BC0, 0x00BCD, 0x00C00, 0x00C04, 0x00C3C,
+    0x00C40, 0x00C48, 0x00C4D, 0x00C56, 0x00C63, 0x00C81, 0x00CBC, 0x00CBF,
+    0x00CC6, 0x00CCD, 0x00CE3, 0x00D01, 0x00D3C, 0x00D44, 0x00D4D, 0x00D63,
+    0x00D81, 0x00DCA, 0x00DD4, 0x00DD6, 0x00E31, 0x00E3A, 0x00E4E, 0x00EB1,
+    0x00EBC, 0x00ECD, 0x00F19, 0x00F35, 0x00F37, 0x00F39, 0x00F7E, 0x00F84,
+    0x00F87, 0x00F97, 0x00FBC, 0x00FC6, 0x01030, 0x01037, 0x0103A, 0x0103E,
+    0x01059, 0x01060, 0x01074, 0x01082, 0x01086, 0x0108D, 0x0109D, 0x0115F,
+    0x011FF, 0x0135F, 0x01714, 0x01733, 0x01753, 0x01773, 0x017B5, 0x017BD,
+    0x017C6, 0x017D3, 0x017DD, 0x0180F, 0x01886, 0x018A9, 0x01922, 0x01928,
+    0x01932, 0x0193B, 0x01A18, 0x01A1B, 0x01A56, 0x01A5E, 0x01A60, 0x01A62,
+    0x01A6C, 0x01A7C, 0x01A7F, 0x01ACE, 0x01B03, 0x01B34, 0x01B3A, 0x01B3C,
+    0x01B42, 0x01B73, 0x01B81, 0x01BA5, 0x01BA9, 0x01BAD, 0x01BE6, 0x01BE9,
+    0x01BED, 0x01BF1, 0x01C33, 0x01C37, 0x01CD2, 0x01CE0, 0x01CE8, 0x01CED,
+    0x01CF4, 0x01CF9, 0x01DFF, 0x0200F, 0x0202E, 0x02064, 0x0206F, 0x020F0,
+    0x0231B, 0x0232A, 0x023EC, 0x023F0, 0x023F3, 0x025FE, 0x02615, 0x02653,
+    0x0267F, 0x02693, 0x026A1, 0x026AB, 0x026BE, 0x026C5, 0x026CE, 0x026D4,
+    0x026EA, 0x026F3, 0x026F5, 0x026FA, 0x026FD, 0x02705, 0x0270B, 0x02728,
+    0x0274C, 0x0274E, 0x02755, 0x02757, 0x02797, 0x027B0, 0x027BF, 0x02B1C,
+    0x02B50, 0x02B55, 0x02CF1, 0x02D7F, 0x02DFF, 0x02E99, 0x02EF3, 0x02FD5,
+    0x02FFB, 0x03029, 0x0302D, 0x0303E, 0x03096, 0x0309A, 0x030FF, 0x0312F,
+    0x0318E, 0x031E3, 0x0321E, 0x03247, 0x04DBF, 0x0A48C, 0x0A4C6, 0x0A672,
+    0x0A67D, 0x0A69F, 0x0A6F1, 0x0A802, 0x0A806, 0x0A80B, 0x0A826, 0x0A82C,
+    0x0A8C5, 0x0A8F1, 0x0A8FF, 0x0A92D, 0x0A951, 0x0A97C, 0x0A982, 0x0A9B3,
+    0x0A9B9, 0x0A9BD, 0x0A9E5, 0x0AA2E, 0x0AA32, 0x0AA36, 0x0AA43, 0x0AA4C,
+    0x0AA7C, 0x0AAB0, 0x0AAB4, 0x0AAB8, 0x0AABF, 0x0AAC1, 0x0AAED, 0x0AAF6,
+    0x0ABE5, 0x0ABE8, 0x0ABED, 0x0D7A3, 0x0FAFF, 0x0FB1E, 0x0FE0F, 0x0FE19,
+    0x0FE2F, 0x0FE52, 0x0FE66, 0x0FE6B, 0x0FEFF, 0x0FF60, 0x0FFE6, 0x0FFFB,
+    0x101FD, 0x102E0, 0x1037A, 0x10A03, 0x10A06, 0x10A0F, 0x10A3A, 0x10A3F,
+    0x10AE6, 0x10D27, 0x10EAC, 0x10F50, 0x10F85, 0x11001, 0x11046, 0x11070,
+    0x11074, 0x11081, 0x110B6, 0x110BA, 0x110BD, 0x110C2, 0x110CD, 0x11102,
+    0x1112B, 0x11134, 0x11173, 0x11181, 0x111BE, 0x111CC, 0x111CF, 0x11231,
+    0x11234, 0x11237, 0x1123E, 0x112DF, 0x112EA, 0x11301, 0x1133C, 0x11340,
+    0x1136C, 0x11374, 0x1143F, 0x11444, 0x11446, 0x1145E, 0x114B8, 0x114BA,
+    0x114C0, 0x114C3, 0x115B5, 0x115BD, 0x115C0, 0x115DD, 0x1163A, 0x1163D,
+    0x11640, 0x116AB, 0x116AD, 0x116B5, 0x116B7, 0x1171F, 0x11725, 0x1172B,
+    0x11837, 0x1183A, 0x1193C, 0x1193E, 0x11943, 0x119D7, 0x119DB, 0x119E0,
+    0x11A0A, 0x11A38, 0x11A3E, 0x11A47, 0x11A56, 0x11A5B, 0x11A96, 0x11A99,
+    0x11C36, 0x11C3D, 0x11C3F, 0x11CA7, 0x11CB0, 0x11CB3, 0x11CB6, 0x11D36,
+    0x11D3A, 0x11D3D, 0x11D45, 0x11D47, 0x11D91, 0x11D95, 0x11D97, 0x11EF4,
+    0x13438, 0x16AF4, 0x16B36, 0x16F4F, 0x16F92, 0x16FE3, 0x16FE4, 0x16FF1,
+    0x187F7, 0x18CD5, 0x18D08, 0x1AFF3, 0x1AFFB, 0x1AFFE, 0x1B122, 0x1B152,
+    0x1B167, 0x1B2FB, 0x1BC9E, 0x1BCA3, 0x1CF2D, 0x1CF46, 0x1D169, 0x1D182,
+    0x1D18B, 0x1D1AD, 0x1D244, 0x1DA36, 0x1DA6C, 0x1DA75, 0x1DA84, 0x1DA9F,
+    0x1DAAF, 0x1E006, 0x1E018, 0x1E021, 0x1E024, 0x1E02A, 0x1E136, 0x1E2AE,
+    0x1E2EF, 0x1E8D6, 0x1E94A, 0x1F004, 0x1F0CF, 0x1F18E, 0x1F19A, 0x1F202,
+    0x1F23B, 0x1F248, 0x1F251, 0x1F265, 0x1F320, 0x1F335, 0x1F37C, 0x1F393,
+    0x1F3CA, 0x1F3D3, 0x1F3F0, 0x1F3F4, 0x1F43E, 0x1F440, 0x1F4FC, 0x1F53D,
+    0x1F54E, 0x1F567, 0x1F57A, 0x1F596, 0x1F5A4, 0x1F64F, 0x1F6C5, 0x1F6CC,
+    0x1F6D2, 0x1F6D7, 0x1F6DF, 0x1F6EC, 0x1F6FC, 0x1F7EB, 0x1F7F0, 0x1F93A,
+    0x1F945, 0x1F9FF, 0x1FA74, 0x1FA7C, 0x1FA86, 0x1FAAC, 0x1FABA, 0x1FAC5,
+    0x1FAD9, 0x1FAE7, 0x1FAF6, 0x2FFFD, 0x3FFFD, 0xE0001, 0xE007F, 0xE01EF,
+)
+_WIDTHS = (
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 2, 2, 2,
+    2, 2, 0, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 2, 2, 0, 0, 2, 0, 2, 2, 2, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0,
+)
+
+
+def char_width(char):
+    """
+    Display width of a single character.
+
+    >>> char_width("a"), char_width("語"), char_width("\\u0301")
+    (1, 2, 0)
+    """
+    code = ord(char)
+    i = bisect.bisect_right(_STARTS, code) - 1
+    if i >= 0 and code <= _ENDS[i]:
+        return _WIDTHS[i]
+    return 1
+
+
+def width(txt):
+    """Display width of txt."""
+    if _ascii(txt):
+        return len(txt)
+    n = _cache.get(txt)
+    if n is None:
+        n = sum([char_width(char) for char in txt])
+        if len(_cache) >= _cache_size:
+            _cache.clear()
+        _cache[txt] = n
+    return n
+
+
+def ljust(txt, length):
+    """str.ljust counting display width."""
+    return txt + " " * (length - width(txt))
+
+
+def rjust(txt, length):
+    """str.rjust counting display width."""
+    return " " * (length - width(txt)) + txt
+
+
+def center(txt, length):
+    """str.center counting display width, with same rounding."""
+    margin = length - width(txt)
+    if margin <= 0:
+        return txt
+    left = margin // 2 + (margin & length & 1)
+    return " " * left + txt + " " * (margin - left)
+
+
+def cut(txt, start, stop):
+    """
+    Slice of txt from cell start to cell stop, as txt[start:stop] counts
+    characters (negative bounds count from the end). Wide characters
+    crossing bounds are replaced by spaces, combining characters follow
+    their base.
+
+    >>> cut("ab日本cd", 1, 5)
+    'b日 '
+    >>> cut("ab日本cd", 3, 8)
+    ' 本cd'
+    """
+    if _ascii(txt):
+        return txt[start:stop]
+    if start < 0 or stop < 0:
+        n = width(txt)
+        start = max(0, start + n) if start < 0 else start
+        stop = max(0, stop + n) if stop < 0 else stop
+    chars, position = [], 0
+    for char in txt:
+        if position >= stop:
+            if position > stop or char_width(char) > 0:
+                break
+        n = char_width(char)
+        end = position + n
+        if n == 0:
+            if start < position or position == start == 0:
+                chars.append(char)
+        elif position >= start and end <= stop:
+            chars.append(char)
+        elif end > start and position < stop:
+            chars.append(" " * (min(end, stop) - max(position, start)))
+        position = end
+    return "".join(chars)
+
+
+def chunks(txt, size):
+    """
+    Generator of consecutive cuts of txt of size cells, same as cut(txt,
+    i, i + size) for i from 0 to the width of txt by size, in a single pass.
+
+    >>> list(chunks("ab日本cd", 3))
+    ['ab ', ' 本', 'cd']
+    """
+    n = width(txt)
+    n_chunks = n // size + 1
+    if _ascii(txt):
+        for i in range(0, n_chunks * size, size):
+            yield txt[i : i + size]
+        return
+    start, stop, k = 0, min(n, size), 0
+    chars, position = [], 0
+    for char in txt:
+        w = char_width(char)
+        if w == 0:
+            # Combining characters follow their base, in the current chunk
+            chars.append(char)
+            continue
+        end = position + w
+        while position >= stop and k < n_chunks - 1:
+            yield "".join(chars)
+            chars, k, start = [], k + 1, start + size
+            stop = min(n, start + size)
+        if end <= stop:
+            chars.append(char)
+        else:
+            # Wide character crossing chunks, replaced by spaces
+            chars.append(" " * (stop - position))
+            while end > stop and k < n_chunks - 1:
+                yield "".join(chars)
+                chars, k, start = [], k + 1, start + size
+                stop = min(n, start + size)
+                chars.append(" " * (min(end, stop) - start))
+        position = end
+    while k < n_chunks:
+        yield "".join(chars)
+        chars, k = [], k + 1
+
+
+def _build_tables():
+    """Print the width table from current unicodedata."""
+    import unicodedata
+
+    try:
+        chr_ = unichr
+    except NameError:
+        chr_ = chr
+    cjk = (
+        (0x3400, 0x4DBF),
+        (0x4E00, 0x9FFF),
+        (0xF900, 0xFAFF),
+        (0x20000, 0x2FFFD),
+        (0x30000, 0x3FFFD),
+    )
+
+    def code_width(code):
+        char = chr_(code)
+        category = unicodedata.category(char)
+        if code != 0xAD and category in ("Mn", "Me", "Cf", "Cc"):
+            return 0
+        if 0x1160 <= code <= 0x11FF:
+            return 0
+        if category == "Cn":
+            return 2 if any(a <= code <= b for a, b in cjk) else 1
+        return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+    ranges = []
+    for code in range(0x110000):
+        n = code_width(code)
+        if n == 1:
+            continue
+        if ranges and ranges[-1][1] == code - 1 and ranges[-1][2] == n:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code, n])
+
+    def rows(values, fmt, per_line):
+        for i in range(0, len(values), per_line):
+            yield "    " + " ".join(fmt % v for v in values[i : i + per_line])
+
+    print("# Generated from unicodedata " + unicodedata.unidata_version)
+    for name, j, fmt, per_line in [
+        ("_STARTS", 0, "0x%05X,", 8),
+        ("_ENDS", 1, "0x%05X,", 8),
+        ("_WIDTHS", 2, "%d,", 24),
+    ]:
+        print(name + " = (")
+        print("\n".join(rows([r[j] for r in ranges], fmt, per_line)))
+        print(")")
+
+
+if __name__ == "__main__":
+
+    _build_tables()
@@ -1,7 +1,299 @@
 #!/usr/bin/env python3
 # -*- coding: utf8 -*-
 
+import collections
+import contextlib
+import functools
+import io
+import itertools
 import math
+import os
+import sys
+import threading
+import time
+
+if __name__ == "__main__" and not __package__:
+    # Run as a script: import helpers from the package, not from this file
+    sys.path[0] = os.path.dirname(os.path.abspath(sys.path[0]))
+
+from line_formater import ansi, display
+
+
+def _table_chunk(settings, kwargs, rows, joined):
+    """Process pool worker of LineFormater._parallel."""
+    line_formater = LineFormater(**settings)
+    if isinstance(kwargs.get("_formater"), str):
+        kwargs["_formater"] = getattr(line_formater, kwargs["_formater"])
+    formater = line_formater.compile_multi(**kwargs)
+    lines = [formater(row) for row in rows]
+    return "\n".join(lines) if joined else lines
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class _Stats(object):
+
+    """Thread safe instrumentation statistics of a LineFormater."""
+
+    timer = getattr(time, "perf_counter", time.time)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.calls, self.times, self.max_depth = {}, {}, 0
+            self.counts = {"cropped": 0, "wrapped_lines": 0}
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counts[name] += n
+
+    def wrap(self, name, method):
+        """Instrumented method."""
+        local, lock, timer = self._local, self._lock, self.timer
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            depth = getattr(local, "depth", 0) + 1
+            local.depth = depth
+            start = timer()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = timer() - start
+                local.depth = depth - 1
+                with lock:
+                    self.calls[name] = self.calls.get(name, 0) + 1
+                    self.times[name] = self.times.get(name, 0.0) + elapsed
+                    self.max_depth = max(self.max_depth, depth)
+
+        return wrapper
+
+    def snapshot(self):
+        with self._lock:
+            snapshot = dict(self.counts)
+            snapshot["calls"] = dict(self.calls)
+            snapshot["times"] = dict(self.times)
+            snapshot["max_depth"] = self.max_depth
+        return snapshot
+
+
+def _cache_key(elts, kwargs, settings):
+    """
+    Hashable key of contents, kwargs of a call and settings of the
+    formater, None if impossible.
+    """
+    contents = tuple(
+        [
+            tuple([str(e) for e in elt]) if isinstance(elt, (tuple, list)) else str(elt)
+            for elt in elts
+        ]
+    )
+    items = [(k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items()]
+    key = (contents, frozenset(items), settings)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _LRUCache(object):
+
+    """Thread safe least recently used mapping of bounded size."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        """Value of key, None if missing."""
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Set value of key, dropping the least recently used if full."""
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+def _fit_lengths(needs, available):
+    """
+    Share available length between columns needing needs lengths.
+    Extra length goes to the last column. If too short, the widest columns
+    are reduced to a common length, narrower ones are kept.
+
+    >>> _fit_lengths([4, 6, 3], 20)
+    [4, 6, 10]
+    >>> _fit_lengths([4, 12, 9], 20)
+    [4, 8, 8]
+    """
+    N = len(needs)
+    extra = available - sum(needs)
+    if extra >= 0:
+        return needs[:-1] + [needs[-1] + extra]
+    lengths = list(needs)
+    for k, i in enumerate(sorted(range(N), key=lambda i: needs[i])):
+        lengths[i] = min(needs[i], available // (N - k))
+        available -= lengths[i]
+    lengths[i] += available
+    return lengths
+
+
+def _shift(txt, shift):
+    """Shift txt of shift characters (right if positive), same length."""
+    if shift > 0:
+        return " " * shift + txt[:-shift]
+    if shift < 0:
+        return txt[-shift:] + " " * -shift
+    return txt
+
+
+def _crop(txt, width, just):
+    """
+    Crop txt to width characters as align does: on the right of left
+    justified contents, on the left of right justified ones, on both sides
+    otherwise.
+
+    >>> _crop("abcdef", 3, "l"), _crop("abcdef", 3, "r"), _crop("abcdef", 3, "c")
+    ('abc', 'def', 'bcd')
+    """
+    n = len(txt) - width
+    if n <= 0:
+        return txt
+    if just == "l":
+        return txt[:width]
+    if just == "r":
+        return txt[n:]
+    return txt[n // 2 : -(n // 2 + n % 2)]
+
+
+# Template characters, in the supplementary private use area A
+_TEMPLATE_BASE = 0xF0000
+_TEMPLATE_SIZE = 0xFFFE
+
+
+def _template_offsets(render, sizes):
+    """
+    Offsets of contents of given sizes in a line formated by render, found
+    once on a template of distinct characters: render is given the list of
+    template contents and returns the line. Return the line and, by
+    content, (position, a, b): characters a to b (excluded) of the content
+    are kept in the line, character i at position + i.
+
+    >>> _template_offsets(lambda elts: "|" + "|".join(elts)[1:6] + "|", [3, 4])[1]
+    [(0, 1, 3), (4, 0, 2)]
+    """
+    templates, k = [], _TEMPLATE_BASE
+    for size in sizes:
+        templates.append("".join(map(chr, range(k, k + size))))
+        k += size
+    line = render(templates)
+    first = chr(_TEMPLATE_BASE)
+    found = {}
+    for position, char in enumerate(line):
+        if char >= first:
+            found[ord(char) - _TEMPLATE_BASE] = position
+    offsets, k = [], 0
+    for size in sizes:
+        kept = [i for i in range(size) if k + i in found]
+        if kept:
+            a, b = kept[0], kept[-1] + 1
+            offsets.append((found[k + a] - a, a, b))
+        else:
+            offsets.append((0, 0, 0))
+        k += size
+    return line, offsets
+
+
+def _word_wrap(txt, width, measure=len):
+    """
+    Split txt on whitespaces into lines not longer than width, as given by
+    measure. Words longer than width are split. Styled whitespaces of ansi
+    encoded txt (measure other than len) are whitespaces too.
+
+    >>> list(_word_wrap("a few words and a verylongword", 8))
+    ['a few', 'words', 'and a', 'verylong', 'word']
+    >>> LF = LineFormater(length=4, crop=False, word_wrap=True)
+    >>> LF.align("abcd\x1b[4m \x1b[0m", width="ansi")
+    'abcd'
+    """
+    width = max(1, width)
+    line, n = [], 0
+    for word in txt.split() if measure is len else ansi.split(txt):
+        n_word = measure(word)
+        if line and n + 1 + n_word <= width:
+            line.append(word)
+            n += 1 + n_word
+            continue
+        if line:
+            yield " ".join(line)
+        start = 0
+        while n_word - start > width:
+            if measure is len:
+                yield word[start : start + width]
+            else:
+                yield display.cut(word, start, start + width)
+            start += width
+        if start > 0:
+            word = word[start:] if measure is len else display.cut(word, start, n_word)
+        line, n = [word], n_word - start
+    yield " ".join(line)
+
+
+def _column_strings(column, fmt):
+    """
+    Contents of column as strings: str of elements if fmt is None, old
+    style formating if fmt contains "%", else format() with fmt as
+    specification. NumPy arrays of numbers are converted in bulk by NumPy.
+
+    >>> _column_strings([1, 2.5, "a"], None)
+    ['1', '2.5', 'a']
+    >>> _column_strings([1, 2.5], "%.2f"), _column_strings([1, 2.5], ">5.1f")
+    (['1.00', '2.50'], ['  1.0', '  2.5'])
+    """
+    kind = getattr(getattr(column, "dtype", None), "kind", None)
+    if kind is not None and type(column).__module__ == "numpy":
+        import numpy
+
+        if fmt is None and kind in "biuf":
+            return column.astype(str).tolist()
+        if fmt is None and kind == "U":
+            return column.tolist()
+        if fmt is not None and "%" in fmt and kind in "biuf":
+            return numpy.char.mod(fmt, column).tolist()
+        if fmt is not None and (kind in "iu" or column.dtype == numpy.float64):
+            column = column.tolist()
+    if fmt is None:
+        return list(map(str, column))
+    if "%" in fmt:
+        return [fmt % (elt,) for elt in column]
+    return list(map(format, column, itertools.repeat(fmt)))
 
 
 class LineFormater(object):
@@ -46,6 +338,18 @@ class LineFormater(object):
                       the length
                False: non length matching content is
                       displayed on several lines
+    word_wrap: Boolean......................................(False)
+             Non cropped content is broken on whitespaces
+             instead of any character.
+    width:   String.........................................("chars")
+             How widths of contents are counted:
+               "chars": number of characters
+               "display": number of terminal cells, wide
+                          characters count twice and
+                          combining ones are ignored
+               "ansi": as display, ANSI style sequences are
+                       ignored and kept around visible
+                       characters (see line_formater.ansi)
 
     Multi and table contexts display iterable's content in columns
     with total width matching length.
@@ -61,9 +365,31 @@ class LineFormater(object):
     seps:    Separator inside columns.......................(" ")
     tips:    Tips of columns................................("")
     crops:   Crop or keep non matching contents.............(True)
+    word_wraps: Word wrap non cropped contents..............(False)
+    v_justs: Vertical justifications of columns.............("t")
+             Position of contents in rows with non cropped
+             contents: "t" top, "m" middle, "b" bottom.
 
     Separate values for each columns can be given using lists.
     None value can be used to keep default of a specific column.
+
+    auto_lengths: Boolean...................................(False)
+             Compute lengths of columns from contents, fitting
+             length. Ignored if lengths are given.
+    auto_sample:  Positive integer..........................(1000)
+             Number of rows used to compute lengths when rows
+             are given as an iterator (see table_rows).
+
+    spec:    FormatSpec.....................................(None)
+             Immutable settings replacing the formater ones
+             for the call (see line_formater.spec).
+
+    cache_size: Positive integer............................(0)
+             Number of results kept in a least recently used
+             cache, 0 disables it (see cache_info).
+    instrument: Boolean.....................................(False)
+             Record calls, timings, crops and wraps (see
+             instrument_stats).
     """
 
     _align_parser = {"l": "ljust", "r": "rjust", "c": "center", "s": "center"}
@@ -78,6 +404,8 @@ class LineFormater(object):
         "sep": " ",
         "tip": "",
         "crop": True,
+        "word_wrap": False,
+        "width": "chars",
         "lengths": None,
         "justs": "l",
         "pads": 0,
@@ -87,8 +415,48 @@ class LineFormater(object):
         "seps": " ",
         "tips": "",
         "crops": True,
+        "word_wraps": False,
+        "v_justs": "t",
+        "auto_lengths": False,
+        "auto_sample": 1000,
+        "cache_size": 0,
+        "instrument": False,
     }
 
+    _setting_names = tuple(sorted(_defaults))
+
+    _table_defaults = {"sep": "|", "tip": "|", "justs": "l", "pads": 1}
+
+    _instrumented = (
+        "align",
+        "center",
+        "left",
+        "right",
+        "spread",
+        "multi_align",
+        "multi_center",
+        "multi_right",
+        "multi_left",
+        "multi_spread",
+        "table",
+        "table_center",
+        "table_left",
+        "table_right",
+        "table_spread",
+        "dictionary",
+        "multi_dictionary",
+        "table_dictionary",
+        "compile",
+        "compile_multi",
+        "compile_table",
+        "table_from_columns",
+        "write_lines",
+        "write_align",
+        "write_table",
+        "write_rows",
+        "write_parallel",
+    )
+
     def __init__(self, **kwargs):
         self.reset()
         self.set(**kwargs)
@@ -112,6 +480,165 @@ class LineFormater(object):
             if key in self._defaults:
                 setattr(self, key, value)
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        # Cache and instrumented methods (bound to self) are made again
+        state.pop("_cache", None)
+        state.pop("_stats", None)
+        for name in self._instrumented:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._set_cache()
+        self._set_instrument()
+
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+        if key in self._defaults:
+            self._set_cache()
+            if key == "instrument":
+                self._set_instrument()
+
+    def _set_instrument(self):
+        """Install or remove instrumented methods."""
+        stats = getattr(self, "_stats", None)
+        if self.instrument and stats is None:
+            stats = _Stats()
+            for name in self._instrumented:
+                object.__setattr__(self, name, stats.wrap(name, getattr(self, name)))
+            object.__setattr__(self, "_stats", stats)
+        elif not self.instrument:
+            if stats is not None:
+                for name in self._instrumented:
+                    object.__delattr__(self, name)
+            object.__setattr__(self, "_stats", None)
+
+    def instrument_stats(self, reset=False):
+        """
+        Snapshot of instrumentation statistics, as a dict:
+          calls:         number of calls of each public method
+          times:         cumulative time in each public method (seconds),
+                         nested calls included
+          max_depth:     deepest nesting of public methods calls
+          cropped:       number of cropped lines
+          wrapped_lines: number of lines of non cropped contents
+        Methods are instrumented only while instrument is True, compiled
+        formaters are then not optimized. Copies get their own statistics.
+        If reset, statistics are cleared.
+
+        >>> LF = LineFormater(length=20, instrument=True)
+        >>> LF.table(["elt1", "very_long_content"])
+        '| elt1   | very_lo |'
+        >>> stats = LF.instrument_stats()
+        >>> sorted(stats["calls"].items())
+        [('align', 2), ('multi_align', 1), ('table', 1)]
+        >>> stats["max_depth"], stats["cropped"], stats["wrapped_lines"]
+        (3, 1, 0)
+        >>> import copy
+        >>> LF2 = copy.copy(LF)
+        >>> LF2.length = 10
+        >>> LF2.align("abcdefghijkl"), LF2.instrument_stats()["calls"]
+        ('abcdefghij', {'align': 1})
+        """
+        if self._stats is None:
+            return None
+        snapshot = self._stats.snapshot()
+        if reset:
+            self._stats.clear()
+        return snapshot
+
+    @contextlib.contextmanager
+    def instrumented(self, hook=None):
+        """
+        Context manager instrumenting methods in its block. At exit, the
+        statistics snapshot (see instrument_stats) is given to hook, if any.
+
+        >>> LF = LineFormater(length=12, crop=False)
+        >>> with LF.instrumented(hook=lambda stats: print(stats["wrapped_lines"])):
+        ...     LF.align("longcontent verylongcontent")
+        'longcontent \\nverylongcont\\nent         '
+        3
+        >>> LF.instrument
+        False
+        """
+        previous = self.instrument
+        self.instrument = True
+        try:
+            yield
+        finally:
+            snapshot = self._stats.snapshot()
+            self.instrument = previous
+            if hook is not None:
+                hook(snapshot)
+
+    def _set_cache(self):
+        """(Re)create the results cache, emptied, after settings changes."""
+        cache = getattr(self, "_cache", None)
+        cache_size = getattr(self, "cache_size", 0)
+        if not cache_size:
+            object.__setattr__(self, "_cache", None)
+        elif cache is None or cache.maxsize != cache_size:
+            object.__setattr__(self, "_cache", _LRUCache(cache_size))
+        else:
+            cache.clear()
+
+    def _settings(self):
+        """Hashable snapshot of the current settings."""
+        return tuple(
+            [
+                tuple(value) if isinstance(value, list) else value
+                for value in [getattr(self, key) for key in self._setting_names]
+            ]
+        )
+
+    def cache_info(self):
+        """
+        Statistics of the results cache, as functools.lru_cache does.
+        Results of align and multi_align (and so of all their interfaces)
+        are cached if cache_size is set. Keys are the stringified contents
+        and the resolved settings. Changing settings empties the cache,
+        copies of the formater get their own empty cache.
+
+        >>> LF = LineFormater(length=20, cache_size=128)
+        >>> LF.dictionary("key", "value") == LF.dictionary("key", "value")
+        True
+        >>> LF.cache_info()
+        CacheInfo(hits=1, misses=4, maxsize=128, currsize=4)
+        >>> LF.set(sep="|")
+        >>> LF.cache_info()
+        CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+        >>> import copy
+        >>> LF.multi_align(["a", "b"]) == copy.deepcopy(LF).multi_align(["a", "b"])
+        True
+        >>> LF.cache_info().currsize, copy.copy(LF).cache_info().currsize
+        (4, 0)
+        """
+        if self._cache is None:
+            return CacheInfo(0, 0, self.cache_size, 0)
+        return self._cache.info()
+
+    def cache_clear(self):
+        """Clear the results cache and its statistics."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _cached_render(self, elts, layout):
+        """_render through the results cache, if any."""
+        cache = self._cache
+        if cache is None:
+            return self._render(elts, layout)
+        if isinstance(elts, (tuple, list)):
+            key = (tuple([str(elt) for elt in elts]), layout)
+        else:
+            key = (str(elts), layout)
+        txt = cache.get(key)
+        if txt is None:
+            txt = self._render(elts, layout)
+            cache.put(key, txt)
+        return txt
+
     def align(self, elts, **kwargs):
         """
         Multi purpose formater.
@@ -146,56 +673,244 @@ class LineFormater(object):
         >>> LF.align(elts, just="s")
         'superverylongcontent\\n verylongcontent lon\\n  gcontent  short   '
         """
-        length = kwargs.get("length", self.length)
-        just = kwargs.get("just", self.just)
-        pad = kwargs.get("pad", self.pad)
-        l_pad = kwargs.get("l_pad", self.l_pad)
-        r_pad = kwargs.get("r_pad", self.r_pad)
+        src = kwargs.get("spec") or self
+        if (
+            self._cache is not None
+            or self._stats is not None
+            or kwargs.get("width", src.width) != "chars"
+        ):
+            return self._cached_render(elts, self._layout(kwargs))
+        # Direct path of plain contents, same output as _render of _layout
+        length = kwargs.get("length", src.length)
+        just = kwargs.get("just", src.just)
+        pad = kwargs.get("pad", src.pad)
+        l_pad = kwargs.get("l_pad", src.l_pad)
+        r_pad = kwargs.get("r_pad", src.r_pad)
         l_pad = pad if l_pad is None else l_pad
         r_pad = pad if r_pad is None else r_pad
-        shift = kwargs.get("shift", self.shift)
-        sep = kwargs.get("sep", self.sep)
-        tip = kwargs.get("tip", self.tip)
-        crop = kwargs.get("crop", self.crop)
+        shift = kwargs.get("shift", src.shift)
+        sep = kwargs.get("sep", src.sep)
+        tip = kwargs.get("tip", src.tip)
         elts = elts if isinstance(elts, (tuple, list)) else [elts]
         elts = [str(elt) for elt in elts]
-        length = length - l_pad - r_pad - len(tip) * 2
+        width = length - l_pad - r_pad - len(tip) * 2
         space, retained = 1, False
         if just == "s" and len(elts) > 1:
             n_chars = sum([len(elt) for elt in elts])
-            space = max(1, (length - n_chars) // (len(elts) - 1))
-            retained = (length - n_chars) % (len(elts) - 1)
+            space = max(1, (width - n_chars) // (len(elts) - 1))
+            retained = (width - n_chars) % (len(elts) - 1)
         txt = (sep * space).join(elts)
         if retained:
             i = txt.rfind(" ")
             txt = txt[:i] + " " + txt[i:]
-        txt = getattr(txt, self._align_parser[just])(length)
-        if shift > 0:
-            txt = " " * shift + txt[:-shift]
-        if shift < 0:
-            txt = txt[-shift:] + " " * -shift
-        if len(txt) > length:
-            if crop:
-                n = len(txt) - length
-                n1, n2 = n // 2, n // 2 + n % 2
-                left, right = (just == "l"), (just == "r")
-                txt = txt[:length] if left else (txt[n:] if right else txt[n1:-n2])
+        txt = getattr(txt, self._align_parser[just])(width)
+        if shift:
+            txt = _shift(txt, shift)
+        if len(txt) > width:
+            if not kwargs.get("crop", src.crop):
+                return "\n".join(self._wrap(elts, txt, self._layout(kwargs)))
+            txt = _crop(txt, width, just)
+        return " " * l_pad + tip + txt + tip + " " * r_pad
+
+    def _layout(self, kwargs):
+        """
+        Resolve align kwargs against current settings into a layout tuple:
+        (width, just, justify, shift, sep, crop, word_wrap, head, tail,
+        measure, styles), where measure gives the width of strings and
+        styles is None or the (encode, decode) functions of ANSI styles,
+        decode being None if styles are kept encoded (_styled="keep").
+        """
+        src = kwargs.get("spec") or self
+        length = kwargs.get("length", src.length)
+        just = kwargs.get("just", src.just)
+        pad = kwargs.get("pad", src.pad)
+        l_pad = kwargs.get("l_pad", src.l_pad)
+        r_pad = kwargs.get("r_pad", src.r_pad)
+        l_pad = pad if l_pad is None else l_pad
+        r_pad = pad if r_pad is None else r_pad
+        shift = kwargs.get("shift", src.shift)
+        sep = kwargs.get("sep", src.sep)
+        tip = kwargs.get("tip", src.tip)
+        crop = kwargs.get("crop", src.crop)
+        word_wrap = kwargs.get("word_wrap", src.word_wrap)
+        mode = kwargs.get("width", src.width)
+        styles = None
+        if mode == "chars":
+            measure = len
+            justify = getattr(str, self._align_parser[just])
+        else:
+            measure = display.width
+            justify = getattr(display, self._align_parser[just])
+            if mode == "ansi":
+                keep = kwargs.get("_styled") == "keep"
+                styles = (ansi.encode, None if keep else ansi.decode)
+        width = length - l_pad - r_pad - measure(tip) * 2
+        head, tail = " " * l_pad + tip, tip + " " * r_pad
+        return (
+            width,
+            just,
+            justify,
+            shift,
+            sep,
+            crop,
+            word_wrap,
+            head,
+            tail,
+            measure,
+            styles,
+        )
+
+    def _text(self, elts, layout):
+        """
+        Join, justify and shift elts with a resolved layout (see _layout).
+        Return elts as strings and the text, which may overflow width.
+        """
+        width, just, justify, shift, sep = layout[:5]
+        measure, styles = layout[9], layout[10]
+        elts = elts if isinstance(elts, (tuple, list)) else [elts]
+        if styles is None:
+            elts = [str(elt) for elt in elts]
+        else:
+            elts = [styles[0](elt) for elt in elts]
+        space, retained = 1, False
+        if just == "s" and len(elts) > 1:
+            n_chars = sum([measure(elt) for elt in elts])
+            space = max(1, (width - n_chars) // (len(elts) - 1))
+            retained = (width - n_chars) % (len(elts) - 1)
+        txt = (sep * space).join(elts)
+        if retained:
+            i = txt.rfind(" ")
+            if i < 0 and styles is not None:
+                i = len(txt.rstrip(ansi.MARKERS)) - 1
+            txt = txt[:i] + " " + txt[i:]
+        txt = justify(txt, width)
+        if measure is not len and shift:
+            n = measure(txt)
+            if shift > 0:
+                txt = " " * shift + display.cut(txt, 0, n - shift)
             else:
-                n_parts = len(txt) // length + 1
-                indexes = (
-                    (i * length, min(len(txt), (i + 1) * length))
-                    for i in range(n_parts)
-                )
-                return "\n".join(
-                    [self.align(txt[i1:i2], **kwargs) for i1, i2 in indexes]
-                )
-        if tip:
-            txt = tip + txt + tip
-        if l_pad > 0:
-            txt = " " * l_pad + txt
-        if r_pad > 0:
-            txt = txt + " " * r_pad
-        return txt
+                txt = display.cut(txt, -shift, n) + " " * -shift
+            return elts, txt
+        if shift:
+            txt = _shift(txt, shift)
+        return elts, txt
+
+    def _line(self, txt, layout):
+        """Crop txt to layout width and add tips and paddings."""
+        width, just = layout[:2]
+        measure = layout[9]
+        if measure(txt) > width:
+            if measure is not len:
+                n = measure(txt) - width
+                start = 0 if just == "l" else (n if just == "r" else n // 2)
+                txt = display.cut(txt, start, start + width)
+            else:
+                txt = _crop(txt, width, just)
+            if self._stats is not None:
+                self._stats.count("cropped")
+        styles = layout[10]
+        if styles is not None and styles[1] is not None:
+            return styles[1](layout[7] + txt + layout[8])
+        return layout[7] + txt + layout[8]
+
+    def _render(self, elts, layout):
+        """Format elts with a resolved layout (see _layout)."""
+        elts, txt = self._text(elts, layout)
+        if layout[9](txt) > layout[0] and not layout[5]:
+            return "\n".join(self._wrap(elts, txt, layout))
+        return self._line(txt, layout)
+
+    def _lines(self, elts, layout):
+        """Generator of the lines of _render."""
+        elts, txt = self._text(elts, layout)
+        if layout[9](txt) > layout[0] and not layout[5]:
+            for line in self._wrap(elts, txt, layout):
+                yield line
+        else:
+            yield self._line(txt, layout)
+
+    def _wrap(self, elts, txt, layout):
+        """
+        Yield lines of elts whose formated txt overflows the layout width,
+        either as consecutive slices of txt or broken on words.
+        """
+        width, just, justify, shift, sep, crop, word_wrap = layout[:7]
+        measure = layout[9]
+        stats = self._stats
+        if word_wrap:
+            for words in _word_wrap(sep.join(elts), width, measure):
+                if stats is not None:
+                    stats.count("wrapped_lines")
+                words = words.split(" ") if just == "s" else words
+                for line in self._lines(words, layout):
+                    yield line
+        else:
+            n = measure(txt)
+            if stats is not None:
+                stats.count("wrapped_lines", n // width + 1)
+            if measure is len:
+                stop = (n // width + 1) * width
+                chunks = (txt[i : i + width] for i in range(0, stop, width))
+            else:
+                chunks = display.chunks(txt, width)
+            for chunk in chunks:
+                for line in self._lines(chunk, layout):
+                    yield line
+
+    def align_lines(self, elts, **kwargs):
+        """
+        Generator of the lines of align. Non cropped contents are wrapped
+        in a single pass. With word_wrap, lines are broken on whitespaces,
+        words longer than the content zone are split.
+
+        >>> LF = LineFormater(length=12, crop=False)
+        >>> list(LF.align_lines("longcontent verylongcontent"))
+        ['longcontent ', 'verylongcont', 'ent         ']
+        >>> for line in LF.align_lines("a few words, verylongcontent", word_wrap=True):
+        ...     print("|" + line + "|")
+        ...
+        |a few words,|
+        |verylongcont|
+        |ent         |
+        """
+        return self._lines(elts, self._layout(kwargs))
+
+    def compile(self, **kwargs):
+        """
+        Compiled align: resolve kwargs once and return a formater taking only
+        the elements, with same output as align. Settings are frozen at
+        compile time, later set() or reset() calls don't affect the formater.
+
+        >>> LF = LineFormater(length=20)
+        >>> center = LF.compile(just="c", tip="|")
+        >>> center("content")
+        '|     content      |'
+        >>> center(["elt1", "elt2"]) == LF.align(["elt1", "elt2"], just="c", tip="|")
+        True
+        >>> crop_right = LF.compile(just="r", length=8, shift=-1)
+        >>> crop_right("very_long_content")
+        'content '
+        """
+        layout = self._layout(kwargs)
+        width, just, justify, shift, sep, crop = layout[:6]
+        head, tail, measure = layout[7:10]
+        render = self._render
+        if measure is not len or self._stats is not None:
+            return functools.partial(render, layout=layout)
+
+        def formater(elts):
+            if isinstance(elts, (tuple, list)):
+                return render(elts, layout)
+            txt = justify(str(elts), width)
+            if shift:
+                txt = _shift(txt, shift)
+            if len(txt) > width:
+                if not crop:
+                    return render(elts, layout)
+                txt = _crop(txt, width, just)
+            return head + txt + tail
+
+        return formater
 
     def center(self, elts, **kwargs):
         """
@@ -242,6 +957,14 @@ class LineFormater(object):
         return self.align(elts, **kwargs)
 
     def _setdefault_as_list(self, kwargs, varname, default, N):
+        var = kwargs.setdefault(varname, default)
+        if var is not None and not isinstance(var, (tuple, list)):
+            if not isinstance(default, (tuple, list)):
+                # Same scalar for all columns
+                var = kwargs[varname] = [var] * N
+                return var
+        elif isinstance(var, list) and len(var) == N and None not in var:
+            return var
         if not isinstance(default, (tuple, list)):
             default = [default] * N
         if len(default) < N:
@@ -252,7 +975,7 @@ class LineFormater(object):
             var = [var] * N
         n_var = len(var)
         if n_var < N:
-            var = var + default[n_var:N]
+            var = list(var) + list(default[n_var:N])
         elif n_var > N:
             var = var[:N]
         var = [default[i] if v is None else v for i, v in enumerate(var)]
@@ -288,43 +1011,242 @@ class LineFormater(object):
         'short     long_cont very_very_\\n                    long_conte\\n                    nt        '
         >>> LF.multi_align(elts, lengths=[5, 12])
         'short long_content very_very_ '
+        >>> LF.multi_align(["a", "long_content", "mid"], auto_lengths=True)
+        'a long_content mid            '
+        >>> print(LF.table(["日本語", "text", "ü"], width="display", justs="c"))
+        | 日本語 |  text  |    ü     |
+        """
+        cache = self._cache
+        if cache is not None:
+            key = _cache_key(elts, kwargs, self._settings())
+            txt = None if key is None else cache.get(key)
+            if txt is not None:
+                return txt
+        src = kwargs.get("spec") or self
+        if kwargs.pop("auto_lengths", src.auto_lengths) and "lengths" not in kwargs:
+            kwargs["lengths"] = self._auto_lengths([elts], kwargs)
+        mode = kwargs.get("width", src.width)
+        if cache is None and self._stats is None and mode == "chars":
+            # Direct path of cropped rows, cells are joined as one content
+            columns = self._columns(len(elts), kwargs)
+            if all(kwargs["crops"]):
+                _formater = kwargs.get("_formater", self.align)
+                formated_elts = [
+                    _formater(elt, **i_kwargs) for elt, i_kwargs in zip(elts, columns)
+                ]
+                return self.align(formated_elts, **kwargs)
+        txt = self._multi_render(elts, self._multi_layout(len(elts), kwargs))
+        if cache is not None and key is not None:
+            cache.put(key, txt)
+        return txt
+
+    def _auto_lengths(self, rows, kwargs):
+        """Lengths of columns fitting the contents of rows in length."""
+        N = max(len(row) for row in rows)
+        probe = dict(kwargs, lengths=[0] * N)
+        columns = self._columns(N, probe)
+        seps = probe["seps"]
+        layouts = [self._layout(i_kwargs) for i_kwargs in columns]
+        widths = [-layout[0] for layout in layouts]
+        measure = layouts[0][9]
+        string = str if layouts[0][10] is None else ansi.encode
+        contents = [0] * N
+        for row in rows:
+            for i, elt in enumerate(row):
+                if isinstance(elt, (tuple, list)):
+                    n = measure(seps[i].join([string(e) for e in elt]))
+                else:
+                    n = measure(string(elt))
+                if n > contents[i]:
+                    contents[i] = n
+        sep, tip, length = probe["sep"], probe["tip"], probe["length"]
+        available = length - len(sep) * (N - 1) - len(tip) * 2
+        return _fit_lengths([w + n for w, n in zip(widths, contents)], available)
+
+    def _auto_rows(self, rows, kwargs):
+        """
+        Set lengths in kwargs from rows contents if auto_lengths is on.
+        Sequences are measured entirely, for iterators only the first
+        auto_sample rows are used. Return rows to be formated.
+        """
+        src = kwargs.get("spec") or self
+        auto_lengths = kwargs.pop("auto_lengths", src.auto_lengths)
+        auto_sample = kwargs.pop("auto_sample", src.auto_sample)
+        kwargs["auto_lengths"] = False
+        if not auto_lengths or "lengths" in kwargs:
+            return rows
+        if hasattr(rows, "__len__") and hasattr(rows, "__getitem__"):
+            sample = rows
+        else:
+            rows = iter(rows)
+            sample = list(itertools.islice(rows, auto_sample))
+            rows = itertools.chain(sample, rows)
+        if len(sample) > 0:
+            kwargs["lengths"] = self._auto_lengths(sample, kwargs)
+        return rows
+
+    def _columns(self, N, kwargs):
         """
-        N = len(elts)
-        sep = kwargs.setdefault("sep", self.sep)
-        tip = kwargs.setdefault("tip", self.tip)
-        length = kwargs.setdefault("length", self.length)
+        Expand multi kwargs in place as lists for N columns.
+        Return the kwargs of each column.
+        """
+        kwargs.pop("auto_lengths", None)
+        src = kwargs.get("spec") or self
+        sep = kwargs.setdefault("sep", src.sep)
+        tip = kwargs.setdefault("tip", src.tip)
+        length = kwargs.setdefault("length", src.length)
         actual_length = length - len(sep) * (N - 1) - len(tip) * 2
         default_length = actual_length // N
         default_remain = default_length + actual_length % N
         default_lengths = [default_length] * (N - 1) + [default_remain]
+        if src.lengths is not None:
+            kwargs.setdefault("lengths", src.lengths)
         self._setdefault_as_list(kwargs, "lengths", default_lengths, N)
-        self._setdefault_as_list(kwargs, "justs", self.justs, N)
-        pads = self._setdefault_as_list(kwargs, "pads", self.pads, N)
-        l_pads = self._setdefault_as_list(kwargs, "l_pads", self.l_pads, N)
-        r_pads = self._setdefault_as_list(kwargs, "r_pads", self.r_pads, N)
+        self._setdefault_as_list(kwargs, "justs", src.justs, N)
+        pads = self._setdefault_as_list(kwargs, "pads", src.pads, N)
+        l_pads = self._setdefault_as_list(kwargs, "l_pads", src.l_pads, N)
+        r_pads = self._setdefault_as_list(kwargs, "r_pads", src.r_pads, N)
         None_N = [None] * N
         kwargs["l_pads"] = pads if l_pads == None_N else l_pads
         kwargs["r_pads"] = pads if r_pads == None_N else r_pads
-        self._setdefault_as_list(kwargs, "shifts", self.shifts, N)
-        self._setdefault_as_list(kwargs, "seps", self.seps, N)
-        crops = self._setdefault_as_list(kwargs, "crops", self.crops, N)
+        self._setdefault_as_list(kwargs, "shifts", src.shifts, N)
+        self._setdefault_as_list(kwargs, "seps", src.seps, N)
+        self._setdefault_as_list(kwargs, "crops", src.crops, N)
+        self._setdefault_as_list(kwargs, "word_wraps", src.word_wraps, N)
+        self._setdefault_as_list(kwargs, "v_justs", src.v_justs, N)
+        tips = kwargs.get("tips", src.tips)
+        if isinstance(tips, (tuple, list)):
+            kwargs["tips"] = tips
+            self._setdefault_as_list(kwargs, "tips", [src.tip] * N, N)
+        columns = [
+            {key[:-1]: value[i] for (key, value) in kwargs.items() if key[-1] == "s"}
+            for i in range(N)
+        ]
+        for key in ("width", "spec"):
+            if key in kwargs:
+                for i_kwargs in columns:
+                    i_kwargs[key] = kwargs[key]
+        return columns
+
+    def _multi_layout(self, N, kwargs, compiled=False):
+        """
+        Resolve multi kwargs for N columns into a layout tuple:
+        (cells, crop, outer, center, blanks, v_justs), where cells are the
+        columns formaters, crop is False if any column is not cropped, outer
+        formats the row and center formats lines of multi-lines rows (None
+        if crop), blanks are the empty lines of columns and v_justs their
+        vertical justifications.
+        Formaters are compiled if required.
+        """
+        columns = self._columns(N, kwargs)
+        crops = kwargs["crops"]
+        if kwargs.get("width", (kwargs.get("spec") or self).width) == "ansi":
+            # Cells are decoded once joined
+            for i_kwargs in columns:
+                i_kwargs["_styled"] = "keep"
         _formater = kwargs.setdefault("_formater", self.align)
-        formated_elts = []
-        for i, elt in enumerate(elts):
-            i_kwargs = {
-                key[:-1]: value[i] for (key, value) in kwargs.items() if key[-1] == "s"
-            }
-            formated_elts.append(_formater(elt, **i_kwargs))
+        if not compiled:
+            make_cell = functools.partial(functools.partial, _formater)
+        elif _formater == self.align:
+            make_cell = self.compile
+        elif _formater == self._right_left:
+            make_cell = functools.partial(self.compile_multi, justs=["r", "l"])
+        else:
+            make_cell = functools.partial(functools.partial, _formater)
+        cells = [make_cell(**i_kwargs) for i_kwargs in columns]
+        center = None
         if not all(crops):
-            n_chars = len(formated_elts[0])
-            n_lines = max([elt.count("\n") + 1 for elt in formated_elts])
-            elts = [elt.split("\n") for elt in formated_elts]
-            elts = [elt + [" " * n_chars] * (n_lines - len(elt)) for elt in elts]
-            return "\n".join(self.center(line, **kwargs) for line in zip(*elts))
-        return self.align(formated_elts, **kwargs)
+            center_kwargs = dict(kwargs)
+            center_kwargs.setdefault("just", "c")
+            if compiled:
+                center = self.compile(**center_kwargs)
+            else:
+                center_layout = self._layout(center_kwargs)
+                center = functools.partial(self._render, layout=center_layout)
+        if compiled:
+            outer = self.compile(**kwargs)
+        else:
+            outer = functools.partial(self._cached_render, layout=self._layout(kwargs))
+        blanks = [" " * length for length in kwargs["lengths"]]
+        return (cells, center is None, outer, center, blanks, kwargs["v_justs"])
+
+    def _multi_render(self, elts, layout):
+        """Format columns elts with a resolved layout (see _multi_layout)."""
+        formated_elts = [cell(elt) for cell, elt in zip(layout[0], elts)]
+        return self._multi_join(formated_elts, layout)
+
+    def _multi_join(self, formated_elts, layout):
+        """Join formated columns with a resolved layout (see _multi_layout)."""
+        if layout[1]:
+            return layout[2](formated_elts)
+        return "\n".join(self._multi_lines(formated_elts, layout))
+
+    def _multi_lines(self, formated_elts, layout):
+        """Generator of the lines of _multi_join."""
+        cells, crop, outer, center, blanks, v_justs = layout
+        if crop:
+            yield outer(formated_elts)
+            return
+        columns = [elt.split("\n") for elt in formated_elts]
+        n_lines = max(map(len, columns))
+        if n_lines == 1:
+            yield center(formated_elts)
+            return
+        for i, column in enumerate(columns):
+            missing = n_lines - len(column)
+            if missing:
+                if v_justs[i] == "b":
+                    top = missing
+                elif v_justs[i] == "m":
+                    top = missing // 2
+                else:
+                    top = 0
+                blank = [blanks[i]]
+                columns[i] = blank * top + column + blank * (missing - top)
+        for line in map(center, zip(*columns)):
+            yield line
+
+    def compile_multi(self, **kwargs):
+        """
+        Compiled multi_align: columns specifications are resolved once for
+        each number of columns met, per row cost is only the cells formating.
+
+        >>> LF = LineFormater(length=30)
+        >>> row = LF.compile_multi(justs=["r", "c", None], sep="|")
+        >>> row(["right", "center", "left"])
+        '    right|  center |left      '
+        >>> row(["elt1", "elt2"])
+        '          elt1|      elt2     '
+        """
+        layouts = {}
+        multi_layout, multi_render = self._multi_layout, self._multi_render
+
+        def formater(elts):
+            N = len(elts)
+            layout = layouts.get(N)
+            if layout is None:
+                layout = layouts[N] = multi_layout(N, dict(kwargs), compiled=True)
+            return multi_render(elts, layout)
+
+        return formater
 
     multi = multi_align
 
+    def multi_rows(self, rows, **kwargs):
+        """
+        Lazy multi_align over an iterable of rows, yielding one formated
+        string per row. Columns specifications are resolved once.
+
+        >>> LF = LineFormater(length=20)
+        >>> rows = iter([["elt1", "elt2"], ["elt3", "elt4"]])
+        >>> list(LF.multi_rows(rows, justs=["r", "l"], sep="|"))
+        ['     elt1|elt2      ', '     elt3|elt4      ']
+        """
+        rows = self._auto_rows(rows, kwargs)
+        formater = self.compile_multi(**kwargs)
+        for row in rows:
+            yield formater(row)
+
     def multi_center(self, elts, **kwargs):
         """
         Center justified columns.
@@ -382,6 +1304,17 @@ class LineFormater(object):
         kwargs.setdefault("justs", ["r", "l"])
         return self.multi_align(elts, **kwargs)
 
+    def _table_kwargs(self, kwargs):
+        """
+        Set table defaults in kwargs, except for settings given to the
+        spec kwarg if any.
+        """
+        spec = kwargs.get("spec")
+        given = () if spec is None else spec.given
+        for key, value in self._table_defaults.items():
+            if key not in given:
+                kwargs.setdefault(key, value)
+
     def table(self, elts, **kwargs):
         """
         Multi purpose table formater.
@@ -390,13 +1323,189 @@ class LineFormater(object):
         >>> LF = LineFormater(length=34)
         >>> LF.table(["elt1", "elt2", "elt3"], justs=["l", "c", "r"])
         '| elt1     |   elt2   |     elt3 |'
+        >>> elts = ["id", "a long text in a row", "x"]
+        >>> crops = [True, False, True]
+        >>> print(LF.table(elts, crops=crops, word_wraps=True, v_justs="m"))
+        |          | a long   |          |
+        | id       | text in  | x        |
+        |          | a row    |          |
         """
-        kwargs.setdefault("sep", "|")
-        kwargs.setdefault("tip", "|")
-        kwargs.setdefault("justs", "l")
-        kwargs.setdefault("pads", 1)
+        self._table_kwargs(kwargs)
         return self.multi_align(elts, **kwargs)
 
+    def compile_table(self, **kwargs):
+        """
+        Compiled table, see compile_multi.
+
+        >>> LF = LineFormater(length=34)
+        >>> row = LF.compile_table(justs=["l", "c", "r"])
+        >>> row(["elt1", "elt2", "elt3"])
+        '| elt1     |   elt2   |     elt3 |'
+        """
+        self._table_kwargs(kwargs)
+        return self.compile_multi(**kwargs)
+
+    def table_from_columns(self, columns, formats=None, **kwargs):
+        """
+        Table of contents given by columns (sequences or NumPy arrays of
+        same length), as a list of formated rows, same as table on each row.
+        formats are format() specifications (eg ".2f") or old style formats
+        (eg "%.2f"), a single one or a list with one by column, None keeps
+        str of contents.
+        Columns are formated in bulk, without per cell formater calls. Rows
+        with multi-lines cells are formated one by one.
+
+        >>> LF = LineFormater(length=30)
+        >>> columns = [["a", "bb", "ccc"], [1, 22.5, 3], [0.5, 1, 2.25]]
+        >>> for line in LF.table_from_columns(columns, formats=[None, None, ".2f"]):
+        ...     print(line)
+        ...
+        | a      | 1      | 0.50     |
+        | bb     | 22.5   | 1.00     |
+        | ccc    | 3      | 2.25     |
+        >>> lines = LF.table_from_columns(columns, justs="r", auto_lengths=True)
+        >>> rows = list(zip(*columns))
+        >>> lines == list(LF.table_rows(rows, justs="r", auto_lengths=True))
+        True
+        >>> print(lines[0])
+        |   a |    1 |           0.5 |
+        >>> columns = [["\\x1b[31mred\\x1b[0m", "b"], ["x", "y"]]
+        >>> LF.table_from_columns(columns, width="ansi", auto_lengths=True)[0]
+        '| \\x1b[31mred\\x1b[0m | x                    |'
+        """
+        self._table_kwargs(kwargs)
+        N = len(columns)
+        if not isinstance(formats, (tuple, list)):
+            formats = [formats] * N
+        formats = list(formats) + [None] * (N - len(formats))
+        strings = list(map(_column_strings, columns, formats))
+        if len(set(map(len, strings))) > 1:
+            raise ValueError("columns have not same lengths")
+        if N == 0 or not strings[0]:
+            return []
+        src = kwargs.get("spec") or self
+        mode = kwargs.get("width", src.width)
+        measure = {"display": display.width, "ansi": ansi.width}.get(mode, len)
+        if kwargs.pop("auto_lengths", src.auto_lengths) and "lengths" not in kwargs:
+            widest = [max(column, key=measure) for column in strings]
+            kwargs["lengths"] = self._auto_lengths([widest], kwargs)
+        kwargs["auto_lengths"] = False
+        rows = None
+        if mode == "chars" and kwargs.get("_formater", self.align) == self.align:
+            rows = self._bulk_rows(strings, dict(kwargs))
+        if rows is None:
+            formater = self.compile_multi(**kwargs)
+            rows = [formater(row) for row in zip(*strings)]
+        return rows
+
+    def _bulk_rows(self, strings, kwargs):
+        """
+        Format rows of columns of strings as table_from_columns, columns
+        by columns. Return None if some rows need to be formated one by one
+        (multi-lines cells, non cropped or spread overflowing rows).
+        """
+        N = len(strings)
+        columns = self._columns(N, kwargs)
+        cells = []
+        for column, i_kwargs in zip(strings, columns):
+            column = self._bulk_cells(column, self._layout(i_kwargs))
+            if column is None:
+                return None
+            cells.append(column)
+        if not all(kwargs["crops"]):
+            if any("\n" in txt for column in strings for txt in column):
+                return None
+            kwargs.setdefault("just", "c")
+        layout = self._layout(kwargs)
+        width, just, justify, shift, sep, crop = layout[:6]
+        n_chars = sum(len(column[0]) for column in cells)
+        space, retained = 1, False
+        if just == "s" and N > 1:
+            space = max(1, (width - n_chars) // (N - 1))
+            retained = (width - n_chars) % (N - 1)
+        n_chars += len(sep) * space * (N - 1)
+        if retained or n_chars > _TEMPLATE_SIZE:
+            return None
+        if not crop and len(self._text(" " * n_chars, layout)[1]) > width:
+            return None
+        rows = list(map((sep * space).join, zip(*cells)))
+        # Rows have same length, their justification, shift and crop is
+        # found once on a template
+        render = lambda elts: self._line(self._text(elts[0], layout)[1], layout)
+        line, ((position, a, b),) = _template_offsets(render, [n_chars])
+        if a == b:
+            return [line] * len(rows)
+        start, stop = position + a, position + b
+        head, tail = line[:start], line[stop:]
+        if a == 0 and b == n_chars and not head and not tail:
+            return rows
+        return [head + row[a:b] + tail for row in rows]
+
+    def _bulk_cells(self, column, layout):
+        """
+        Format a column of strings with a resolved layout (see _layout).
+        Return None if some contents overflow a non cropped column, or if
+        the column is narrower than its paddings and tips.
+        """
+        width, just, justify, shift, sep, crop, word_wrap, head, tail = layout[:9]
+        if width < 0:
+            return None
+        cells = list(map(justify, column, itertools.repeat(width)))
+        if shift:
+            cells = [_shift(cell, shift) for cell in cells]
+        if max(map(len, cells)) > width:
+            if not crop:
+                return None
+            cells = [_crop(cell, width, just) for cell in cells]
+        if head or tail:
+            cells = [head + cell + tail for cell in cells]
+        return cells
+
+    def table_rows(self, rows, **kwargs):
+        """
+        Lazy table over an iterable of rows, see multi_rows.
+
+        >>> LF = LineFormater(length=23)
+        >>> for line in LF.table_rows([["key", "value"], ["foo", 1]]):
+        ...     print(line)
+        ...
+        | key      | value    |
+        | foo      | 1        |
+        >>> rows = iter([["id", "name"], [1, "foo"], [22, "foobar"]])
+        >>> for line in LF.table_rows(rows, auto_lengths=True, auto_sample=2):
+        ...     print(line)
+        ...
+        | id | name           |
+        | 1  | foo            |
+        | 22 | foobar         |
+        """
+        self._table_kwargs(kwargs)
+        rows = self._auto_rows(rows, kwargs)
+        formater = self.compile_multi(**kwargs)
+        for row in rows:
+            yield formater(row)
+
+    def _table_lines(self, rows, kwargs):
+        """
+        Generator of the lines of table_rows, lines of multi-lines rows are
+        yielded one by one rather than joined.
+        """
+        self._table_kwargs(kwargs)
+        rows = self._auto_rows(rows, kwargs)
+        layouts = {}
+        multi_layout, multi_lines = self._multi_layout, self._multi_lines
+        for row in rows:
+            N = len(row)
+            layout = layouts.get(N)
+            if layout is None:
+                layout = layouts[N] = multi_layout(N, dict(kwargs), compiled=True)
+            formated_elts = [cell(elt) for cell, elt in zip(layout[0], row)]
+            if layout[1]:
+                yield layout[2](formated_elts)
+            else:
+                for line in multi_lines(formated_elts, layout):
+                    yield line
+
     def table_center(self, elts, **kwargs):
         """
         Center justified tables.
@@ -480,6 +1589,171 @@ class LineFormater(object):
         kwargs.setdefault("seps", ": ")
         return self.table(list(zip(keys, values)), **kwargs)
 
+    def write_lines(self, stream, lines, flush_size=65536, encoding="utf-8"):
+        """
+        Write lines, each followed by a newline, to a text or binary stream.
+        Lines are buffered and written every flush_size characters, binary
+        streams get them encoded. Return the number of lines written, lines
+        with newlines counting as several.
+
+        >>> import io
+        >>> stream = io.BytesIO()
+        >>> LineFormater().write_lines(stream, ["foo", "bar"])
+        2
+        >>> stream.getvalue()
+        b'foo\\nbar\\n'
+        """
+        write = stream.write
+        mode = getattr(stream, "mode", "")
+        binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) or (
+            isinstance(mode, str) and "b" in mode
+        )
+        buffer, size, n_lines = [], 0, 0
+        for line in lines:
+            buffer.append(line)
+            size += len(line) + 1
+            if size >= flush_size:
+                buffer.append("")
+                data = "\n".join(buffer)
+                n_lines += data.count("\n")
+                write(data.encode(encoding) if binary else data)
+                buffer, size = [], 0
+        if buffer:
+            buffer.append("")
+            data = "\n".join(buffer)
+            n_lines += data.count("\n")
+            write(data.encode(encoding) if binary else data)
+        return n_lines
+
+    def write_align(self, stream, elts, flush_size=65536, encoding="utf-8", **kwargs):
+        """
+        Write lines of align to stream, see write_lines.
+
+        >>> import io
+        >>> stream = io.StringIO()
+        >>> LF = LineFormater(length=12, crop=False)
+        >>> LF.write_align(stream, "longcontent verylongcontent", just="r")
+        3
+        >>> stream.getvalue().splitlines()
+        ['longcontent ', 'verylongcont', '         ent']
+        """
+        lines = self.align_lines(elts, **kwargs)
+        return self.write_lines(stream, lines, flush_size, encoding)
+
+    def write_table(self, stream, elts, flush_size=65536, encoding="utf-8", **kwargs):
+        """
+        Write lines of table to stream, see write_lines.
+
+        >>> import io
+        >>> stream = io.StringIO()
+        >>> LF = LineFormater(length=23)
+        >>> LF.write_table(stream, ["key", "value"])
+        1
+        >>> stream.getvalue()
+        '| key      | value    |\\n'
+        >>> LF.write_table(io.StringIO(), ["id", "long content"], crops=[True, False])
+        2
+        """
+        lines = self._table_lines([elts], kwargs)
+        return self.write_lines(stream, lines, flush_size, encoding)
+
+    def write_rows(self, stream, rows, flush_size=65536, encoding="utf-8", **kwargs):
+        """
+        Write lines of table_rows to stream, see write_lines.
+
+        >>> import io
+        >>> stream = io.StringIO()
+        >>> LF = LineFormater(length=23)
+        >>> LF.write_rows(stream, [["key", "value"], ["foo", 1]], justs="r")
+        2
+        >>> print(stream.getvalue(), end="")
+        |      key |    value |
+        |      foo |        1 |
+        >>> rows = [["id", "text"], [1, "a long content"]]
+        >>> LF.write_rows(stream, rows, crops=[True, False])
+        3
+        """
+        lines = self._table_lines(rows, kwargs)
+        return self.write_lines(stream, lines, flush_size, encoding)
+
+    def _parallel(self, rows, workers, chunksize, joined, kwargs):
+        """
+        Yield (number of rows, formated rows) of table chunks rendered in a
+        process pool, in order, with at most 2 chunks per worker in flight.
+        Formated rows are a list, or a single string if joined.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._table_kwargs(kwargs)
+        rows = iter(self._auto_rows(rows, kwargs))
+        _formater = kwargs.get("_formater")
+        if getattr(_formater, "__self__", None) is self:
+            kwargs["_formater"] = _formater.__name__
+        settings = {key: getattr(self, key) for key in self._defaults}
+        settings["cache_size"] = 0
+        settings["instrument"] = False
+        workers = workers or os.cpu_count() or 1
+        pending = collections.deque()
+        with ProcessPoolExecutor(workers) as executor:
+            for chunk in iter(lambda: list(itertools.islice(rows, chunksize)), []):
+                future = executor.submit(_table_chunk, settings, kwargs, chunk, joined)
+                pending.append((len(chunk), future))
+                if len(pending) >= 2 * workers:
+                    n_rows, future = pending.popleft()
+                    yield n_rows, future.result()
+            while pending:
+                n_rows, future = pending.popleft()
+                yield n_rows, future.result()
+
+    def render_parallel(self, rows, workers=None, chunksize=1000, **kwargs):
+        """
+        Lazy table over an iterable of rows, as table_rows, rendered by
+        chunks of chunksize rows in a pool of workers processes (default is
+        the number of CPUs). Settings and kwargs must be picklable.
+
+        >>> LF = LineFormater(length=23)
+        >>> rows = ([i, i * i] for i in range(1000))
+        >>> lines = list(LF.render_parallel(rows, workers=2, chunksize=100))
+        >>> lines[999]
+        '| 999      | 998001   |'
+        """
+        for n_rows, lines in self._parallel(rows, workers, chunksize, False, kwargs):
+            for line in lines:
+                yield line
+
+    def write_parallel(
+        self,
+        stream,
+        rows,
+        workers=None,
+        chunksize=1000,
+        flush_size=65536,
+        encoding="utf-8",
+        **kwargs
+    ):
+        """
+        Write render_parallel to stream, see write_lines.
+        Chunks are joined in workers. Return the number of rows.
+
+        >>> import io
+        >>> stream = io.StringIO()
+        >>> LF = LineFormater(length=23)
+        >>> LF.write_parallel(stream, [[i, -i] for i in range(10)], chunksize=3)
+        10
+        >>> stream.getvalue().splitlines()[-1]
+        '| 9        | -9       |'
+        """
+        chunks = self._parallel(rows, workers, chunksize, True, kwargs)
+        counts = []
+
+        def texts():
+            for n_rows, text in chunks:
+                counts.append(n_rows)
+                yield text
+
+        self.write_lines(stream, texts(), flush_size, encoding)
+        return sum(counts)
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Logging formater of records as aligned columns.
+
+Columns are attributes of LogRecord (levelname, name, message, asctime...,
+or extra ones) with their ColumnSpec. The layout is resolved and compiled
+once at construction, formating a record is then only the formating of its
+cells. The message is still formated lazily (record.getMessage, only for
+records emitted), exceptions and stacks follow the line as with
+logging.Formatter. Formaters hold no state changed by format: they can be
+shared by handlers of several threads.
+
+>>> import logging
+>>> columns = [
+...     ("levelname", ColumnSpec(length=8)),
+...     ("name", ColumnSpec(length=6)),
+...     ("message", None),
+... ]
+>>> formater = LineFormatterLogFormatter(columns, length=40)
+>>> record = logging.LogRecord("app", logging.INFO, "", 0, "%d rows", (12,), None)
+>>> formater.format(record)
+'INFO     app    12 rows                 '
+>>> record = logging.LogRecord("app.db", logging.WARNING, "", 0, "slow", (), None)
+>>> formater.format(record)
+'WARNING  app.db slow                    '
+"""
+
+import logging
+import operator
+
+from line_formater.line_formater import LineFormater
+from line_formater.spec import ColumnSpec
+
+
+class LineFormatterLogFormatter(logging.Formatter):
+    """
+    logging.Formatter of records as table (or multi_align if not table)
+    rows. columns is a mapping (or a sequence of pairs) of LogRecord
+    attributes and their ColumnSpec (or a dict of its settings, or None).
+    Columns without length share the length left by the others. kwargs are
+    settings of the row (length, sep, tip...). Attributes missing from a
+    record take their value in defaults, "" otherwise.
+
+    >>> import logging
+    >>> columns = {
+    ...     "levelname": ColumnSpec(length=9, just="r"),
+    ...     "message": {"crop": False},
+    ... }
+    >>> formater = LineFormatterLogFormatter(columns, table=True, length=30)
+    >>> record = logging.LogRecord(
+    ...     "app", logging.ERROR, "", 0, "disk %s is full", ("sda",), None
+    ... )
+    >>> print(formater.format(record))
+    |   ERROR | disk sda is full |
+    >>> record.args = ("/dev/nvme0n1p2",)
+    >>> print(formater.format(record))
+    |   ERROR | disk /dev/nvme0n |
+    |         | 1p2 is full      |
+    """
+
+    def __init__(
+        self,
+        columns,
+        line_formater=None,
+        table=False,
+        datefmt=None,
+        defaults=None,
+        **kwargs
+    ):
+        logging.Formatter.__init__(self, datefmt=datefmt)
+        line_formater = line_formater or LineFormater()
+        if hasattr(columns, "items"):
+            columns = columns.items()
+        attributes, specs = [], []
+        for attribute, column in columns:
+            if column is None:
+                column = ColumnSpec()
+            elif not isinstance(column, ColumnSpec):
+                column = ColumnSpec(**column)
+            attributes.append(attribute)
+            specs.append(column)
+        if not attributes:
+            raise ValueError("no columns to format")
+        N = len(attributes)
+        if table:
+            line_formater._table_kwargs(kwargs)
+        for key in ColumnSpec._fields:
+            values = [getattr(column, key) for column in specs]
+            if any(value is not None for value in values):
+                default = kwargs.get(key + "s")
+                if not isinstance(default, (tuple, list)):
+                    default = [default] * N
+                default = list(default) + [None] * N
+                kwargs[key + "s"] = [
+                    default[i] if value is None else value
+                    for i, value in enumerate(values)
+                ]
+        kwargs.pop("auto_lengths", None)
+        kwargs["lengths"] = self._lengths(N, line_formater, kwargs)
+        self.attributes = tuple(attributes)
+        self._defaults = dict(defaults or {})
+        self._uses_time = "asctime" in self.attributes
+        get = operator.attrgetter(*attributes)
+        self._get = get if N > 1 else (lambda record: (get(record),))
+        layout = line_formater._multi_layout(N, kwargs, compiled=True)
+        render = line_formater._multi_render
+        self._render = lambda values: render(values, layout)
+
+    @staticmethod
+    def _lengths(N, line_formater, kwargs):
+        """Lengths of columns, those not given share the length left."""
+        src = kwargs.get("spec") or line_formater
+        lengths = kwargs.get("lengths", src.lengths)
+        if not isinstance(lengths, (tuple, list)):
+            lengths = [lengths] * N
+        lengths = (list(lengths) + [None] * N)[:N]
+        missing = [i for i, length in enumerate(lengths) if length is None]
+        if missing:
+            sep = kwargs.get("sep", src.sep)
+            tip = kwargs.get("tip", src.tip)
+            length = kwargs.get("length", src.length)
+            given = sum(length for length in lengths if length is not None)
+            left = max(0, length - len(sep) * (N - 1) - len(tip) * 2 - given)
+            for i in missing:
+                lengths[i] = left // len(missing)
+            lengths[missing[-1]] += left % len(missing)
+        return lengths
+
+    def usesTime(self):
+        return self._uses_time
+
+    def formatMessage(self, record):
+        try:
+            values = self._get(record)
+        except AttributeError:
+            defaults = self._defaults
+            values = [
+                getattr(record, attribute, defaults.get(attribute, ""))
+                for attribute in self.attributes
+            ]
+        return self._render(values)
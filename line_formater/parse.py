@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Parsers of lines formated by table or multi_align, back into fields.
+
+Offsets of the contents of each column are found once, from the same
+kwargs as used to format (lengths, justs, pads, sep, tip...), by formating
+a template row. Fields are then slices of lines at these offsets, stripped
+of padding spaces according to the justification of their column: right
+spaces for left justified columns, left ones for right justified columns,
+both otherwise. Contents cropped or shifted when formated can't be parsed
+back entirely, multi-lines rows are parsed line by line.
+
+>>> from line_formater import LineFormater
+>>> LF = LineFormater(length=30)
+>>> line = LF.table(["foo", 12, "bar"], justs=["l", "r", "c"])
+>>> line
+'| foo    |     12 |   bar    |'
+>>> parse = compile_parser(3, LF, justs=["l", "r", "c"])
+>>> parse(line), parse(line.encode())
+(['foo', '12', 'bar'], [b'foo', b'12', b'bar'])
+"""
+
+import functools
+
+from line_formater.line_formater import LineFormater, _template_offsets
+
+
+def offsets(N, line_formater=None, table=True, **kwargs):
+    """
+    List of (start, stop) offsets of the contents of the N columns in
+    table (or multi_align if not table) formated lines, and length of lines.
+
+    >>> offsets(2, LineFormater(length=23))
+    ([(2, 10), (13, 21)], 23)
+    """
+    bounds, length, justs = _resolve(N, line_formater, table, kwargs)
+    return bounds, length
+
+
+def _resolve(N, line_formater, table, kwargs):
+    """Offsets of contents, length of lines and justs of columns."""
+    line_formater = line_formater or LineFormater()
+    if table:
+        line_formater._table_kwargs(kwargs)
+    kwargs.pop("auto_lengths", None)
+    if kwargs.get("width", (kwargs.get("spec") or line_formater).width) != "chars":
+        raise ValueError('only lines formated with width="chars" can be parsed')
+    columns = line_formater._columns(N, kwargs)
+    widths = [max(0, line_formater._layout(i_kwargs)[0]) for i_kwargs in columns]
+    layout = line_formater._multi_layout(N, dict(kwargs))
+    render = functools.partial(line_formater._multi_render, layout=layout)
+    line, offsets = _template_offsets(render, widths)
+    if "\n" in line:
+        raise ValueError("columns don't fit in length")
+    bounds = [(position + a, position + b) for position, a, b in offsets]
+    return bounds, len(line), kwargs["justs"]
+
+
+def _specs(bounds, justs, fields, cls):
+    """(start, stop, strip method) of fields, from their columns justs."""
+    names = {"l": "rstrip", "r": "lstrip"}
+    fields = range(len(bounds)) if fields is None else fields
+    return [
+        (bounds[i][0], bounds[i][1], getattr(cls, names.get(justs[i], "strip")))
+        for i in fields
+    ]
+
+
+def compile_parser(N, line_formater=None, table=True, fields=None, **kwargs):
+    """
+    Compiled parser of lines (str or bytes-like) formated as table (or
+    multi_align if not table) rows of N columns with kwargs. It returns the
+    list of fields (str for str lines, bytes otherwise), only those of
+    columns indices fields if given.
+
+    >>> LF = LineFormater(length=23)
+    >>> parse = compile_parser(2, LF, fields=[1])
+    >>> parse("| key      | value    |")
+    ['value']
+    """
+    bounds, length, justs = _resolve(N, line_formater, table, kwargs)
+    str_specs = _specs(bounds, justs, fields, str)
+    bytes_specs = _specs(bounds, justs, fields, bytes)
+
+    def parser(line):
+        if isinstance(line, str):
+            return [strip(line[a:b], " ") for a, b, strip in str_specs]
+        view = memoryview(line)
+        return [strip(view[a:b].tobytes(), b" ") for a, b, strip in bytes_specs]
+
+    return parser
+
+
+def parse_rows(data, N, line_formater=None, table=True, fields=None, **kwargs):
+    """
+    Generator of the fields of lines formated as table (or multi_align if
+    not table) rows of N columns with kwargs, see compile_parser.
+    data is an iterable of lines, or a bytes-like buffer (bytes, bytearray,
+    memoryview, mmap) of records: lines and newlines, records being found
+    by offset arithmetic (records of a record_size kwarg, default is the
+    length of lines plus one), the last one may have no newline. Buffers
+    must be of a single byte encoding (ASCII, latin-1), only fields are
+    copied.
+
+    >>> data = b"| foo      |        1 |\\n| bar      |       22 |\\n"
+    >>> list(parse_rows(memoryview(data), 2, LineFormater(length=23), justs=["l", "r"]))
+    [[b'foo', b'1'], [b'bar', b'22']]
+    >>> list(parse_rows(data[:-1], 2, LineFormater(length=23), fields=[1], justs="r"))
+    [[b'1'], [b'22']]
+    >>> list(parse_rows(data[:-2], 2, LineFormater(length=23)))
+    Traceback (most recent call last):
+    ...
+    ValueError: 22 trailing bytes are not a record of 24 bytes
+    """
+    record_size = kwargs.pop("record_size", None)
+    try:
+        view = memoryview(data)
+    except TypeError:
+        parser = compile_parser(N, line_formater, table, fields, **kwargs)
+        for line in data:
+            yield parser(line)
+        return
+    bounds, length, justs = _resolve(N, line_formater, table, kwargs)
+    specs = _specs(bounds, justs, fields, bytes)
+    record_size = record_size or length + 1
+    n_bytes = len(view) * view.itemsize
+    view = view.cast("B") if view.format != "B" or view.ndim != 1 else view
+    remainder = n_bytes % record_size
+    if remainder and remainder != record_size - 1:
+        message = "{} trailing bytes are not a record of {} bytes"
+        raise ValueError(message.format(remainder, record_size))
+    # The last record may have no newline
+    stop = n_bytes - remainder
+    for offset in range(0, n_bytes, record_size):
+        if offset < stop and view[offset + record_size - 1] != 10:
+            message = "no newline at the end of record at byte {}"
+            raise ValueError(message.format(offset))
+        yield [
+            strip(view[offset + a : offset + b].tobytes(), b" ")
+            for a, b, strip in specs
+        ]
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Fixed size records files of formated rows, with random access.
+
+Formated lines all have the same length, written as records of the same
+size in bytes (line, padding spaces if needed, newline), line i of a file
+starts at i * record_size. The file stays a readable text file, a
+RecordFile memory maps it and reads any line or range of lines without
+scanning the file. A RecordPacker formats rows as bytes directly into
+records of a buffer. Records are latin-1 encoded by default, lines of a
+multi-byte encoding (utf-8) are padded to an explicit record_size.
+
+>>> import os, tempfile
+>>> path = os.path.join(tempfile.mkdtemp(), "table.txt")
+>>> rows = [["id", "name"]] + [[i, "name%d" % i] for i in range(1000)]
+>>> with open(path, "wb") as stream:
+...     write_records(stream, rows, LineFormater(length=23))
+...
+1001
+>>> with RecordFile(path) as records:
+...     print(len(records), records.record_size)
+...     print(records[0])
+...     print(records[500])
+...     print(records[-2:])
+...
+1001 24
+| id       | name     |
+| 499      | name499  |
+['| 998      | name998  |', '| 999      | name999  |']
+>>> with open(path, "wb") as stream:
+...     write_records(
+...         stream, [["id", "name"], [1, "f\u00f4\u00f6"]], LineFormater(length=23),
+...         record_size=48, encoding="utf-8",
+...     )
+...
+2
+>>> with RecordFile(path, encoding="utf-8", length=23) as records:
+...     print(records.record_size, records[1:])
+...
+48 ['| 1        | f\xf4\xf6      |']
+>>> os.remove(path)
+"""
+
+import functools
+import mmap
+import os
+
+from line_formater.line_formater import LineFormater, _template_offsets
+
+
+def _multi_byte(encoding):
+    """Whether characters may take several bytes in encoding."""
+    return any(len(char.encode(encoding, "ignore")) > 1 for char in u" \xff\u20ac")
+
+
+def write_records(
+    stream,
+    rows,
+    line_formater=None,
+    table=True,
+    record_size=None,
+    flush_size=65536,
+    encoding="latin-1",
+    **kwargs
+):
+    """
+    Write table (or multi_align if not table) formated rows to the binary
+    stream as records of record_size bytes, newline included. Rows with
+    non cropped contents make several records, one by line.
+    record_size defaults to the size of the first line, shorter lines are
+    padded with spaces. It must be given for multi-byte encodings (utf-8),
+    whose lines have varying sizes, and for width modes other than "chars",
+    whose lines have varying numbers of characters.
+    Records are buffered and written every flush_size bytes.
+    Return the number of records.
+
+    >>> import io
+    >>> stream = io.BytesIO()
+    >>> write_records(
+    ...     stream, [["\u00e9", 1], ["e", 2]], LineFormater(length=9),
+    ...     record_size=12, encoding="utf-8",
+    ... )
+    2
+    >>> stream.getvalue()
+    b'| \\xc3\\xa9 | 1 | \\n| e | 2 |  \\n'
+    >>> write_records(stream, [["\u00e9", 1]], LineFormater(length=9), encoding="utf-8")
+    Traceback (most recent call last):
+    ...
+    ValueError: record_size must be given for the multi-byte encoding utf-8
+    """
+    line_formater = line_formater or LineFormater()
+    width = kwargs.get("width", (kwargs.get("spec") or line_formater).width)
+    if record_size is None and width != "chars":
+        message = 'record_size must be given for lines of width "{}"'
+        raise ValueError(message.format(width))
+    if record_size is None and _multi_byte(encoding):
+        message = "record_size must be given for the multi-byte encoding {}"
+        raise ValueError(message.format(encoding))
+    if table:
+        lines = line_formater.table_rows(rows, **kwargs)
+    else:
+        lines = line_formater.multi_rows(rows, **kwargs)
+    buffer, size, n_records = [], 0, 0
+    for text in lines:
+        for line in text.split("\n"):
+            record = line.encode(encoding)
+            if record_size is None:
+                record_size = len(record) + 1
+            missing = record_size - 1 - len(record)
+            if missing < 0:
+                message = "line of {} bytes doesn't fit records of {} bytes: {!r}"
+                raise ValueError(message.format(len(record) + 1, record_size, line))
+            if missing:
+                record += b" " * missing
+            buffer.append(record)
+            size += record_size
+            n_records += 1
+        if size >= flush_size:
+            stream.write(b"\n".join(buffer) + b"\n")
+            buffer, size = [], 0
+    if buffer:
+        stream.write(b"\n".join(buffer) + b"\n")
+    return n_records
+
+
+class RecordFile(object):
+    """
+    Memory mapped records file written by write_records. Indexing gives
+    lines (without newline) by offset arithmetic, record_size is found from
+    the first line. length is the number of characters of padded lines (of
+    a multi-byte encoding), the padding after them is dropped.
+    """
+
+    def __init__(self, path, encoding="latin-1", length=None):
+        self.encoding = encoding
+        self.length = length
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size:
+                self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._data = b""
+            self.record_size = self._data.find(b"\n") + 1
+            if size and (not self.record_size or size % self.record_size):
+                raise ValueError("{} is not a records file".format(path))
+        except Exception:
+            self.close()
+            raise
+        self._len = size // self.record_size if size else 0
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._len)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if start >= stop:
+                return []
+            text = self.raw(start, stop).tobytes().decode(self.encoding)
+            lines = text[:-1].split("\n")
+            if self.length is not None:
+                lines = [line[: self.length] for line in lines]
+            return lines
+        if key < 0:
+            key += self._len
+        if not 0 <= key < self._len:
+            raise IndexError("record index out of range")
+        offset = key * self.record_size
+        line = self._data[offset : offset + self.record_size - 1].decode(self.encoding)
+        return line if self.length is None else line[: self.length]
+
+    def raw(self, start, stop=None):
+        """
+        Memoryview of the bytes of records from start to stop (excluded,
+        default is start + 1), newlines included, without copy. Views must
+        be released before close.
+        """
+        stop = start + 1 if stop is None else stop
+        start, stop = max(0, min(start, self._len)), max(0, min(stop, self._len))
+        size = self.record_size
+        return memoryview(self._data)[start * size : max(start, stop) * size]
+
+    def close(self):
+        """Close the mapping and the file."""
+        if isinstance(getattr(self, "_data", None), mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RecordPacker(object):
+    """
+    Compiled bytes formater of table (or multi_align if not table) rows of
+    N columns into records of record_size bytes (line, padding spaces,
+    newline), as struct.Struct for binary records. Columns positions are
+    resolved once; each record is a copy of a blank record where contents
+    (bytes, or str and other objects encoded with encoding) are written in
+    place, without intermediate strings. Cells with shifts or iterables of
+    elements are formated as strings first.
+    encoding must be single byte (latin-1, ascii), columns must be cropped
+    and kwargs of width "chars". Output is the same as the encoded table.
+
+    >>> packer = RecordPacker(2, LineFormater(length=23), justs=["l", "r"])
+    >>> packer.record_size
+    24
+    >>> packer.pack([b"foo", 12]).tobytes()
+    b'| foo      |       12 |\\n'
+    >>> buffer = bytearray(b"." * 52)
+    >>> packer.pack_into(buffer, 2, ["caf\xe9", 3.5]).tobytes()
+    b'| caf\\xe9     |      3.5 |\\n'
+    >>> bytes(packer.pack_rows([["a", 1], ["b", 2]]))
+    b'| a        |        1 |\\n| b        |        2 |\\n'
+    """
+
+    def __init__(
+        self,
+        N,
+        line_formater=None,
+        table=True,
+        record_size=None,
+        encoding="latin-1",
+        **kwargs
+    ):
+        line_formater = line_formater or LineFormater()
+        if table:
+            line_formater._table_kwargs(kwargs)
+        kwargs.pop("auto_lengths", None)
+        if kwargs.get("width", (kwargs.get("spec") or line_formater).width) != "chars":
+            raise ValueError('only contents of width="chars" can be packed')
+        if len(" ".encode(encoding)) != 1:
+            raise ValueError("{} is not a single byte encoding".format(encoding))
+        columns = line_formater._columns(N, dict(kwargs))
+        layouts = [line_formater._layout(i_kwargs) for i_kwargs in columns]
+        layout = line_formater._multi_layout(N, kwargs, compiled=True)
+        if not layout[1]:
+            raise ValueError("non cropped columns can't be packed")
+        if any(i_layout[0] < 0 for i_layout in layouts):
+            raise ValueError("columns are narrower than their paddings and tips")
+        outer = line_formater._layout(kwargs)
+        n_chars = sum(kwargs["lengths"]) + len(outer[4]) * (N - 1)
+        if outer[1] == "s" and N > 1 and (outer[0] - n_chars) % (N - 1):
+            raise ValueError("spread rows with unequal spaces can't be packed")
+        cells = layout[0]
+        blank = line_formater._multi_join([cell("") for cell in cells], layout)
+        # Positions of columns in lines are found on a template of formated
+        # cells
+        render = functools.partial(line_formater._multi_join, layout=layout)
+        line, offsets = _template_offsets(render, kwargs["lengths"])
+        if len(line) != len(blank) or "\n" in line:
+            raise ValueError("rows don't fit a single line")
+        self._columns = []
+        for cell, i_layout, length, (position, a, b) in zip(
+            cells, layouts, kwargs["lengths"], offsets
+        ):
+            width, just, shift = i_layout[0], i_layout[1], i_layout[3]
+            head = i_layout[7]
+            full = a == 0 and b == length
+            self._columns.append(
+                (cell, width, just, shift, position + len(head), len(head), a, b, full)
+            )
+        record = blank.encode(encoding)
+        if record_size is None:
+            record_size = len(record) + 1
+        if record_size < len(record) + 1:
+            message = "lines of {} bytes don't fit records of {} bytes"
+            raise ValueError(message.format(len(record) + 1, record_size))
+        self.record_size = record_size
+        self.encoding = encoding
+        self._record = record.ljust(record_size - 1) + b"\n"
+        self._buffer = bytearray(self._record)
+        self._view = memoryview(self._buffer)
+        self._rows_buffer = bytearray()
+
+    def _fill(self, view, offset, row):
+        """Write the record of row in view at offset."""
+        encoding = self.encoding
+        view[offset : offset + self.record_size] = self._record
+        for elt, column in zip(row, self._columns):
+            cell, width, just, shift, start, head, a, b, full = column
+            if shift or isinstance(elt, (tuple, list)):
+                if isinstance(elt, (bytes, bytearray)):
+                    elt = elt.decode(encoding)
+                elif isinstance(elt, (tuple, list)):
+                    elt = [
+                        e.decode(encoding) if isinstance(e, (bytes, bytearray)) else e
+                        for e in elt
+                    ]
+                data = cell(elt).encode(encoding)
+                start = offset + start - head
+                view[start + a : start + b] = data[a:b]
+                continue
+            if isinstance(elt, (bytes, bytearray)):
+                data = elt
+            else:
+                data = str(elt).encode(encoding)
+            n = len(data)
+            if n < width:
+                missing = width - n
+                if just == "l":
+                    position = 0
+                elif just == "r":
+                    position = missing
+                else:
+                    # Same rounding as str.center
+                    position = missing // 2 + (missing & width & 1)
+            else:
+                position = 0
+                if n > width:
+                    if just == "l":
+                        first = 0
+                    elif just == "r":
+                        first = n - width
+                    else:
+                        first = (n - width) // 2
+                    data = memoryview(data)[first : first + width]
+                    n = width
+            if full:
+                position += offset + start
+                view[position : position + n] = data
+                continue
+            # Row cropped by the outer layout
+            q0 = head + position
+            lo, hi = max(q0, a), min(q0 + n, b)
+            if lo < hi:
+                start = offset + start - head
+                view[start + lo : start + hi] = data[lo - q0 : hi - q0]
+
+    def pack(self, row):
+        """
+        Record of row in a reusable buffer, as a memoryview overwritten by
+        the next call (not thread safe, copy it to keep it).
+        """
+        self._fill(self._buffer, 0, row)
+        return self._view
+
+    def pack_into(self, buffer, offset, row):
+        """
+        Write the record of row in the writable buffer (bytearray, mmap,
+        memoryview...) at offset. Return a memoryview of the record.
+        """
+        view = buffer if isinstance(buffer, bytearray) else memoryview(buffer).cast("B")
+        size = self.record_size
+        if offset < 0 or offset + size > len(view):
+            message = "pack_into requires a buffer of at least {} bytes for offset {}"
+            raise ValueError(message.format(offset + size, offset))
+        self._fill(view, offset, row)
+        return memoryview(view)[offset : offset + size]
+
+    def pack_rows(self, rows, buffer=None, offset=0):
+        """
+        Write records of rows consecutively in the writable buffer from
+        offset, or in a reusable buffer (reallocated only if too small) if
+        no buffer is given. Return a memoryview of the records.
+        """
+        size = self.record_size
+        if buffer is None:
+            rows = rows if isinstance(rows, (tuple, list)) else list(rows)
+            if len(self._rows_buffer) < len(rows) * size:
+                # New buffer: views of the previous one may still be used
+                self._rows_buffer = bytearray(len(rows) * size)
+            buffer, offset = self._rows_buffer, 0
+        view = buffer if isinstance(buffer, bytearray) else memoryview(buffer).cast("B")
+        start = offset
+        fill = self._fill
+        for row in rows:
+            if offset < 0 or offset + size > len(view):
+                message = "pack_rows requires a buffer of more than {} bytes"
+                raise ValueError(message.format(len(view)))
+            fill(view, offset, row)
+            offset += size
+        return memoryview(view)[start:offset]
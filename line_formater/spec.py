@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Immutable formating specifications.
+
+A FormatSpec holds a whole set of LineFormater settings, validated once at
+construction. It is hashable, so it can key caches and be shared between
+threads or sent to processes, and can be given to any formating method with
+the spec kwarg, replacing the formater settings (kwargs still override it).
+Variants are derived with with_.
+
+A ColumnSpec holds the settings of a single column; a FormatSpec built with
+columns gets its plural settings (lengths, justs...) from them.
+
+>>> from line_formater import LineFormater
+>>> LF = LineFormater()
+>>> spec = FormatSpec(length=10, just="r")
+>>> LF.align("abc", spec=spec)
+'       abc'
+>>> LF.align("abc", spec=spec.with_(just="c"))
+'   abc    '
+>>> columns = [ColumnSpec(length=6, just="r"), ColumnSpec(just="c")]
+>>> LF.table(["ab", "cd"], spec=FormatSpec(length=20, columns=columns))
+'|   ab |    cd     |'
+>>> FormatSpec(just="x")
+Traceback (most recent call last):
+...
+ValueError: just must be one of 'l', 'c', 'r', 's', not 'x'
+"""
+
+from line_formater.line_formater import LineFormater
+
+
+_JUSTS = ("l", "c", "r", "s")
+_V_JUSTS = ("t", "m", "b")
+_WIDTHS = ("chars", "display", "ansi")
+
+
+def _check_int(name, value, minimum=None, none=False):
+    if value is None and none:
+        return value
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError("{} must be an integer, not {!r}".format(name, value))
+    if minimum is not None and value < minimum:
+        message = "{} must be greater or equal to {}, not {!r}"
+        raise ValueError(message.format(name, minimum, value))
+    return value
+
+
+def _check_just(name, value, none=False):
+    if value is None and none:
+        return value
+    if value not in _JUSTS:
+        message = "{} must be one of {}, not {!r}"
+        raise ValueError(message.format(name, ", ".join(map(repr, _JUSTS)), value))
+    return value
+
+
+def _check_str(name, value, none=False):
+    if value is None and none:
+        return value
+    if not isinstance(value, str):
+        raise ValueError("{} must be a string, not {!r}".format(name, value))
+    return value
+
+
+def _check_bool(name, value, none=False):
+    if value is None and none:
+        return value
+    if not isinstance(value, bool):
+        raise ValueError("{} must be a boolean, not {!r}".format(name, value))
+    return value
+
+
+def _check_pad(name, value, none=False):
+    return _check_int(name, value, 0, none)
+
+
+def _check_length(name, value, none=False):
+    return _check_int(name, value, 0, none)
+
+
+def _check_shift(name, value, none=False):
+    return _check_int(name, value, None, none)
+
+
+def _check_v_just(name, value, none=False):
+    if value is None and none:
+        return value
+    if value not in _V_JUSTS:
+        message = "{} must be one of {}, not {!r}"
+        raise ValueError(message.format(name, ", ".join(map(repr, _V_JUSTS)), value))
+    return value
+
+
+def _check_width(name, value, none=False):
+    if value is None and none:
+        return value
+    if value not in _WIDTHS:
+        message = "{} must be one of {}, not {!r}"
+        raise ValueError(message.format(name, ", ".join(map(repr, _WIDTHS)), value))
+    return value
+
+
+# Settings of a column, with their checks
+_COLUMN_CHECKS = (
+    ("length", _check_length),
+    ("just", _check_just),
+    ("pad", _check_pad),
+    ("l_pad", _check_pad),
+    ("r_pad", _check_pad),
+    ("shift", _check_shift),
+    ("sep", _check_str),
+    ("tip", _check_str),
+    ("crop", _check_bool),
+    ("word_wrap", _check_bool),
+    ("v_just", _check_v_just),
+)
+
+# Settings of the formater, v_just has only a plural form
+_SCALAR_CHECKS = _COLUMN_CHECKS[:-1] + (("width", _check_width),)
+
+# Plurals keeping None for a column, others use their scalar default
+_NONE_PLURALS = ("lengths", "l_pads", "r_pads", "tips")
+
+
+def _check_plural(name, value, check, none):
+    if isinstance(value, (tuple, list)):
+        return tuple(check(name, v, True) for v in value)
+    return check(name, value, none)
+
+
+class _Spec(object):
+    """Immutable slotted value object, base of FormatSpec and ColumnSpec."""
+
+    __slots__ = ("_given", "_values", "given")
+
+    _fields = ()
+
+    def __setattr__(self, key, value):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __delattr__(self, key):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def _freeze(self, given, values):
+        for key, value in given.items():
+            if isinstance(value, list):
+                given[key] = tuple(value)
+        object.__setattr__(self, "_given", given)
+        object.__setattr__(self, "given", self._explicit(given))
+        object.__setattr__(self, "_values", tuple(values[key] for key in self._fields))
+        for key in self._fields:
+            object.__setattr__(self, key, values[key])
+
+    def _explicit(self, given):
+        return frozenset(given)
+
+    def with_(self, **changes):
+        """Return a new spec with changes applied, validated again."""
+        kwargs = dict(self._given)
+        kwargs.update(changes)
+        return type(self)(**kwargs)
+
+    def as_dict(self):
+        """Return the settings of the spec as a dictionary."""
+        return dict(zip(self._fields, self._values))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values == other._values
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash((type(self).__name__, self._values))
+
+    def __reduce__(self):
+        return (_rebuild, (type(self), self._given))
+
+    def __repr__(self):
+        items = ", ".join(
+            "{}={!r}".format(key, value) for key, value in sorted(self._given.items())
+        )
+        return "{}({})".format(type(self).__name__, items)
+
+
+def _rebuild(cls, given):
+    return cls(**given)
+
+
+class ColumnSpec(_Spec):
+    """
+    Settings of a single column, None keeps the default of the spec.
+
+    >>> ColumnSpec(length=8, just="r")
+    ColumnSpec(just='r', length=8)
+    >>> ColumnSpec(length=8) == ColumnSpec(length=8)
+    True
+    """
+
+    _fields = tuple(key for key, check in _COLUMN_CHECKS)
+
+    __slots__ = _fields
+
+    def __init__(self, **kwargs):
+        given = dict(kwargs)
+        values = {}
+        for key, check in _COLUMN_CHECKS:
+            values[key] = check(key, kwargs.pop(key, None), True)
+        if kwargs:
+            message = "unexpected column settings: {}"
+            raise ValueError(message.format(", ".join(sorted(kwargs))))
+        self._freeze(given, values)
+
+
+class FormatSpec(_Spec):
+    """
+    Settings of a LineFormater, see LineFormater for their meaning.
+    Defaults are the ones of LineFormater; cache_size and instrument are
+    formater level settings and are not part of a spec.
+
+    >>> spec = FormatSpec(length=20, justs=["r", "l"])
+    >>> spec.justs
+    ('r', 'l')
+    >>> spec == FormatSpec(length=20, justs=("r", "l"))
+    True
+    >>> spec.with_(length=30).length, spec.length
+    (30, 20)
+    >>> spec.length = 30
+    Traceback (most recent call last):
+    ...
+    AttributeError: FormatSpec is immutable
+    """
+
+    _plurals = tuple(key + "s" for key, check in _COLUMN_CHECKS)
+
+    _fields = (
+        tuple(key for key, check in _SCALAR_CHECKS)
+        + _plurals
+        + ("auto_lengths", "auto_sample", "columns")
+    )
+
+    __slots__ = _fields
+
+    def __init__(self, columns=None, **kwargs):
+        given = dict(kwargs)
+        if columns is not None:
+            given["columns"] = columns
+        unexpected = set(kwargs) - set(self._fields)
+        if unexpected:
+            message = "unexpected settings: {}"
+            raise ValueError(message.format(", ".join(sorted(unexpected))))
+        defaults = LineFormater._defaults
+        values = {}
+        for key, check in _SCALAR_CHECKS:
+            none = key in ("l_pad", "r_pad")
+            values[key] = check(key, kwargs.get(key, defaults[key]), none)
+        if columns is not None:
+            columns = tuple(columns)
+            for column in columns:
+                if not isinstance(column, ColumnSpec):
+                    message = "columns must be ColumnSpec, not {!r}"
+                    raise ValueError(message.format(column))
+            given_plurals = set(self._plurals) & set(kwargs)
+            if given_plurals:
+                message = "{} can't be given with columns"
+                raise ValueError(message.format(", ".join(sorted(given_plurals))))
+        for key, check in _COLUMN_CHECKS:
+            plural = key + "s"
+            if columns is None:
+                none = plural in _NONE_PLURALS
+                value = kwargs.get(plural, defaults[plural])
+                value = _check_plural(plural, value, check, none)
+            else:
+                default = None if plural in _NONE_PLURALS else defaults[plural]
+                value = tuple(
+                    default if getattr(column, key) is None else getattr(column, key)
+                    for column in columns
+                )
+            values[plural] = value
+        values["auto_lengths"] = _check_bool(
+            "auto_lengths", kwargs.get("auto_lengths", defaults["auto_lengths"])
+        )
+        values["auto_sample"] = _check_int(
+            "auto_sample", kwargs.get("auto_sample", defaults["auto_sample"]), 1
+        )
+        values["columns"] = columns
+        self._freeze(given, values)
+
+    def _explicit(self, given):
+        explicit = set(given) - {"columns"}
+        for column in given.get("columns") or ():
+            explicit.update(
+                key + "s" for key in column.given if getattr(column, key) is not None
+            )
+        return frozenset(explicit)
+
+    @classmethod
+    def from_formater(cls, line_formater, **changes):
+        """
+        Spec of the current settings of line_formater, with changes.
+
+        >>> LF = LineFormater(length=12, just="c")
+        >>> spec = FormatSpec.from_formater(LF, pad=1)
+        >>> (spec.length, spec.just, spec.pad)
+        (12, 'c', 1)
+        """
+        kwargs = {}
+        for key in cls._fields:
+            if key != "columns":
+                kwargs[key] = getattr(line_formater, key)
+        for key in cls._plurals:
+            if isinstance(kwargs[key], list):
+                kwargs[key] = tuple(kwargs[key])
+        kwargs.update(changes)
+        if kwargs.get("columns") is not None:
+            for key in cls._plurals:
+                kwargs.pop(key)
+        return cls(**kwargs)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+Incremental table views, for tables redrawn often with few changes.
+
+A TableView keeps the values of the cells, their formated fragments and the
+lines of the table. Setting a cell only marks it dirty; refresh formats the
+dirty cells again, joins their rows and returns the lines that changed, so
+the cost of a refresh follows the number of changes, not the table size.
+"""
+
+from line_formater.line_formater import LineFormater
+
+
+class TableView(object):
+    """
+    Table (or multi_align if not table) of rows of values, all rows having
+    the same number of columns (at least one row of one column). Columns
+    specifications are resolved once from kwargs, auto_lengths uses the
+    initial rows.
+
+    >>> view = TableView([["key", "value"], ["foo", 1]], LineFormater(length=23))
+    >>> print(view.render())
+    | key      | value    |
+    | foo      | 1        |
+    >>> view[1, 1] = 2
+    >>> view.refresh()
+    [(1, '| foo      | 2        |')]
+    >>> view.refresh()
+    []
+    >>> view = TableView([["foo", 1], ["bar", 2]], LineFormater(length=23), crops=False)
+    >>> view.update({(0, 1): "a long value", (1, 0): "baz"})
+    >>> for index, line in view.refresh():
+    ...     print(index, line)
+    ...
+    0 | foo      | a long v |
+    1 |          | alue     |
+    2 | baz      | 2        |
+    >>> TableView([])
+    Traceback (most recent call last):
+    ...
+    ValueError: a table view needs rows of at least one column
+    """
+
+    def __init__(self, rows, line_formater=None, table=True, **kwargs):
+        line_formater = line_formater or LineFormater()
+        if table:
+            line_formater._table_kwargs(kwargs)
+        rows = [list(row) for row in line_formater._auto_rows(rows, kwargs)]
+        if not rows or not rows[0]:
+            raise ValueError("a table view needs rows of at least one column")
+        N = len(rows[0])
+        if any(len(row) != N for row in rows):
+            raise ValueError("rows have not same number of columns")
+        self._line_formater = line_formater
+        self._layout = line_formater._multi_layout(N, kwargs, compiled=True)
+        self._values = rows
+        self._dirty = {}
+        cells = self._layout[0]
+        join = line_formater._multi_join
+        self._cells = [[cell(elt) for cell, elt in zip(cells, row)] for row in rows]
+        self._rows = [join(row, self._layout).split("\n") for row in self._cells]
+        self._offsets = []
+        self._lines = []
+        self._reindex(0)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, key):
+        i, j = key
+        return self._values[i][j]
+
+    def __setitem__(self, key, value):
+        i, j = key
+        self._values[i][j] = value
+        self._dirty.setdefault(i, set()).add(j)
+
+    def update(self, changes):
+        """
+        Set values of cells from a mapping (or iterable of pairs) of
+        (row, column) and values.
+        """
+        if hasattr(changes, "items"):
+            changes = changes.items()
+        for key, value in changes:
+            self[key] = value
+
+    def set_row(self, i, row):
+        """Set all the values of row i."""
+        row = list(row)
+        if len(row) != len(self._values[i]):
+            raise ValueError("row has not the number of columns of the table")
+        self._values[i] = row
+        self._dirty[i] = set(range(len(row)))
+
+    @property
+    def lines(self):
+        """Lines of the table, as of last refresh."""
+        return list(self._lines)
+
+    def _reindex(self, start):
+        """Rebuild offsets and lines of rows from row start."""
+        del self._offsets[start:]
+        offset = self._offsets[-1] + len(self._rows[start - 1]) if start else 0
+        lines = self._lines[:offset]
+        for row in self._rows[start:]:
+            self._offsets.append(offset)
+            lines.extend(row)
+            offset += len(row)
+        self._lines = lines
+
+    def refresh(self):
+        """
+        Format dirty cells and their rows. Return a list of (index, text)
+        of the lines changed since last refresh; text is None for lines
+        removed at the end of the table (when rows get fewer lines).
+        """
+        dirty, self._dirty = self._dirty, {}
+        layout, cells = self._layout, self._layout[0]
+        join = self._line_formater._multi_join
+        changed = []
+        reindex = None
+        for i in sorted(dirty):
+            row, values = self._cells[i], self._values[i]
+            modified = False
+            for j in dirty[i]:
+                fragment = cells[j](values[j])
+                if fragment != row[j]:
+                    row[j] = fragment
+                    modified = True
+            if not modified:
+                continue
+            lines = join(row, layout).split("\n")
+            if len(lines) != len(self._rows[i]) and reindex is None:
+                reindex = i
+            self._rows[i] = lines
+            if reindex is None:
+                offset = self._offsets[i]
+                for k, line in enumerate(lines):
+                    if self._lines[offset + k] != line:
+                        self._lines[offset + k] = line
+                        changed.append((offset + k, line))
+        if reindex is not None:
+            start = self._offsets[reindex]
+            old = self._lines
+            self._reindex(reindex)
+            for k in range(start, max(len(old), len(self._lines))):
+                line = self._lines[k] if k < len(self._lines) else None
+                if k >= len(old) or old[k] != line:
+                    changed.append((k, line))
+        return changed
+
+    def render(self):
+        """Refresh and return the whole table."""
+        self.refresh()
+        return "\n".join(self._lines)